@@ -0,0 +1,60 @@
+"""
+Small in-process TTL cache for rarely-changing lookups.
+
+Entries expire after a fixed time-to-live (monotonic clock) and the cache
+holds at most `maxsize` keys, evicting the oldest insert first. It is
+per-process: with several workers each one keeps its own copy, so the TTL
+bounds how long a stale value can be served after a write elsewhere.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Dict-like cache with per-entry expiry."""
+    
+    def __init__(self, ttl_sec: float, maxsize: int = 128):
+        self.ttl_sec = ttl_sec
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing or expired."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for `ttl_sec` seconds."""
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl_sec, value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return a value (expired entries count as missing)."""
+        value = self.get(key, _MISSING)
+        self._data.pop(key, None)
+        return default if value is _MISSING else value
+    
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or everything when no key is given."""
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        return len(self._data)
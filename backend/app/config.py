@@ -1,6 +1,7 @@
 """Application configuration with GDPR-aware defaults."""
 import os
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 from cryptography.fernet import Fernet
 
@@ -8,6 +9,12 @@ from cryptography.fernet import Fernet
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./data/voicecompanion.db"
+    RUN_MIGRATIONS: bool = True  # MVP column/index migrations in init_db
+    # Queue pool sizing (SQLite gets an explicit AsyncAdaptedQueuePool for it)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection
+    DB_NULL_POOL: bool = False  # No pooling, sizing ignored; one connection per session
     
     # OpenAI (GPT-4o for reasoning)
     OPENAI_API_KEY: str = ""
@@ -36,6 +43,7 @@ class Settings(BaseSettings):
     
     # Application
     BASE_URL: str = "http://localhost:8000"
+    LOG_LEVEL: str = "INFO"  # DEBUG enables per-frame/stream diagnostics
     
     # GDPR Settings
     DEFAULT_RETENTION_DAYS: int = 30
@@ -43,36 +51,64 @@ class Settings(BaseSettings):
     EU_HOSTING_ONLY: bool = True
     NO_TRAINING_USE: bool = True
     
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
 settings = Settings()
 
 
+@lru_cache(maxsize=1)
+def _build_fernet(key: str) -> Fernet:
+    """Build the Fernet instance once per key (key parsing is not free)."""
+    return Fernet(key.encode())
+
+
 def get_fernet() -> Optional[Fernet]:
     """Get Fernet instance for encryption, or None if not configured."""
     if settings.FERNET_KEY:
-        return Fernet(settings.FERNET_KEY.encode())
+        return _build_fernet(settings.FERNET_KEY)
     return None
 
 
+# Resolved once at import so the per-call paths are a single global read
+ENCRYPTION_ENABLED: bool = bool(settings.FERNET_KEY)
+_CACHED_FERNET: Optional[Fernet] = get_fernet()
+
+
+def invalidate_fernet_cache() -> None:
+    """Rebuild the cached Fernet instance (e.g. after changing FERNET_KEY in tests)."""
+    global ENCRYPTION_ENABLED, _CACHED_FERNET
+    _build_fernet.cache_clear()
+    ENCRYPTION_ENABLED = bool(settings.FERNET_KEY)
+    _CACHED_FERNET = get_fernet()
+
+
 def encrypt_text(text: str) -> str:
     """Encrypt text if FERNET_KEY is set, otherwise return as-is."""
-    fernet = get_fernet()
-    if fernet and text:
-        return fernet.encrypt(text.encode()).decode()
+    if _CACHED_FERNET and text:
+        return _CACHED_FERNET.encrypt(text.encode()).decode()
     return text
 
 
+# Every Fernet token starts with this (0x80 version byte + 32-bit timestamp high bytes)
+FERNET_TOKEN_PREFIX = "gAAAAA"
+
+
 def decrypt_text(text: str) -> str:
     """Decrypt text if FERNET_KEY is set, otherwise return as-is."""
-    fernet = get_fernet()
-    if fernet and text:
+    if _CACHED_FERNET and text and text.startswith(FERNET_TOKEN_PREFIX):
         try:
-            return fernet.decrypt(text.encode()).decode()
+            return _CACHED_FERNET.decrypt(text.encode()).decode()
         except Exception:
             return text  # Return as-is if decryption fails
     return text
 
+
+def decrypt_texts(items: list[tuple[Optional[str], bool]]) -> list[Optional[str]]:
+    """
+    Decrypt a batch of (text, is_encrypted) pairs with the shared Fernet instance.
+    
+    Plaintext and missing entries pass through unchanged.
+    """
+    decrypt = decrypt_text
+    return [decrypt(text) if is_encrypted and text else text for text, is_encrypted in items]
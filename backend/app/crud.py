@@ -1,13 +1,25 @@
 """CRUD operations with multi-tenant (account_id) filtering."""
-from datetime import datetime, timedelta
-from typing import Optional, List
-from sqlalchemy import select, func, and_
+import asyncio
+from datetime import timedelta
+from typing import AsyncIterator, Optional, List
+from sqlalchemy import select, update, delete, func, and_, or_, case
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, raiseload
 
 from app.models import Account, Person, Call, Transcript, CallAnalysis, MemoryState, TwilioNumber
 from app.schemas import PersonCreate, PersonUpdate, CallCreate, CallUpdate, CallAnalysisCreate
-from app.config import encrypt_text, decrypt_text, settings
+from app import config
+from app.config import encrypt_text, decrypt_text
+from app.database import async_session_maker, utcnow, UtcTimestamp
+from app.cache import TTLCache
+
+
+def _insert(db: AsyncSession, model):
+    """INSERT construct for the session's dialect (supports ON CONFLICT)."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
 
 
 # ============= Account CRUD =============
@@ -56,8 +68,76 @@ async def get_people(
     return list(result.scalars().all())
 
 
-async def create_person(db: AsyncSession, person: PersonCreate) -> Person:
-    """Create a new person with extended profile data."""
+def _people_with_stats_query(account_id: int, kind: Optional[str], skip: int, limit: int):
+    """Statement for people of an account with their aggregated call stats."""
+    week_ago = utcnow() - timedelta(days=7)
+    query = (
+        select(
+            Person,
+            func.count(Call.id).label("total_calls"),
+            func.count(case((Call.created_at >= week_ago, Call.id))).label("calls_this_week"),
+            func.avg(Call.duration_sec).label("avg_duration_sec"),
+            func.max(Call.created_at).label("last_call_at"),
+            func.avg(CallAnalysis.sentiment_score).label("avg_sentiment_score")
+        )
+        .outerjoin(Call, Call.person_id == Person.id)
+        .outerjoin(CallAnalysis, CallAnalysis.call_id == Call.id)
+        .where(Person.account_id == account_id)
+    )
+    if kind:
+        query = query.where(Person.kind == kind)
+    return (
+        query.group_by(Person.id)
+        .order_by(Person.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+async def get_people_with_stats(
+    db: AsyncSession,
+    account_id: int,
+    kind: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> list:
+    """
+    Get people for an account together with their call stats in one query.
+    
+    Returns (Person, total_calls, calls_this_week, avg_duration_sec,
+    last_call_at, avg_sentiment_score) rows, newest person first.
+    """
+    result = await db.execute(_people_with_stats_query(account_id, kind, skip, limit))
+    return list(result.all())
+
+
+async def stream_people_with_stats(
+    account_id: int,
+    kind: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    chunk_size: int = 200
+) -> AsyncIterator:
+    """
+    Stream the rows of get_people_with_stats in chunks of `chunk_size`.
+    
+    Opens its own session: it is consumed while the response is being sent,
+    after request-scoped dependencies have been closed.
+    """
+    query = _people_with_stats_query(account_id, kind, skip, limit)
+    async with async_session_maker() as session:
+        result = await session.stream(query.execution_options(yield_per=chunk_size))
+        async for row in result:
+            yield row
+
+
+async def create_person(db: AsyncSession, person: PersonCreate) -> Optional[Person]:
+    """
+    Create a new person with extended profile data.
+    
+    Returns None if the phone number is already taken (the insert is a
+    single INSERT ... ON CONFLICT DO NOTHING, so there is no check/insert race).
+    """
     # Default account based on kind
     account_id = person.account_id
     if not account_id:
@@ -73,75 +153,102 @@ async def create_person(db: AsyncSession, person: PersonCreate) -> Person:
     if person.address:
         address_json = person.address.model_dump(exclude_unset=True)
     
-    db_person = Person(
-        account_id=account_id,
-        kind=person.kind,
-        display_name=person.display_name,
-        phone_e164=person.phone_e164,
-        language=person.language,
-        consent_recording=person.consent_recording,
-        retention_days=person.retention_days,
-        age=person.age,
-        personal_context_json=personal_context_json,
-        address_json=address_json
+    stmt = (
+        _insert(db, Person)
+        .values(
+            account_id=account_id,
+            kind=person.kind,
+            display_name=person.display_name,
+            phone_e164=person.phone_e164,
+            language=person.language,
+            consent_recording=person.consent_recording,
+            retention_days=person.retention_days,
+            age=person.age,
+            personal_context_json=personal_context_json,
+            address_json=address_json
+        )
+        .on_conflict_do_nothing(index_elements=[Person.phone_e164])
+        .returning(Person)
     )
-    db.add(db_person)
-    await db.commit()
-    await db.refresh(db_person)
+    result = await db.execute(stmt)
+    db_person = result.scalar_one_or_none()
+    if db_person is None:
+        await db.rollback()
+        return None
     
-    # Create empty memory state
+    # Create empty memory state in the same transaction
     memory = MemoryState(person_id=db_person.id, memory_json={})
     db.add(memory)
     await db.commit()
+    await db.refresh(db_person)
     
     return db_person
 
 
 async def update_person(db: AsyncSession, person_id: int, updates: PersonUpdate, account_id: Optional[int] = None) -> Optional[Person]:
     """Update a person's details with extended profile data."""
-    person = await get_person(db, person_id, account_id)
-    if not person:
-        return None
-    
     update_data = updates.model_dump(exclude_unset=True)
     
     # Handle nested personal_context
-    if "personal_context" in update_data and update_data["personal_context"]:
-        person.personal_context_json = update_data.pop("personal_context")
-    elif "personal_context" in update_data:
-        update_data.pop("personal_context")
+    personal_context = update_data.pop("personal_context", None)
+    if personal_context:
+        update_data["personal_context_json"] = personal_context
     
     # Handle nested address
-    if "address" in update_data and update_data["address"]:
-        person.address_json = update_data.pop("address")
-    elif "address" in update_data:
-        update_data.pop("address")
+    address = update_data.pop("address", None)
+    if address:
+        update_data["address_json"] = address
     
-    # Update remaining flat fields
-    for field, value in update_data.items():
-        setattr(person, field, value)
+    if not update_data:
+        return await get_person(db, person_id, account_id)
     
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+    stmt = update(Person).where(Person.id == person_id)
+    if account_id:
+        stmt = stmt.where(Person.account_id == account_id)
+    result = await db.execute(
+        stmt.values(**update_data).returning(Person),
+        execution_options={"populate_existing": True}
+    )
+    person = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(person)
     return person
 
 
-async def check_phone_exists(db: AsyncSession, phone_e164: str, exclude_person_id: Optional[int] = None) -> bool:
-    """Check if phone number already exists (for uniqueness validation)."""
-    query = select(Person).where(Person.phone_e164 == phone_e164)
-    if exclude_person_id:
-        query = query.where(Person.id != exclude_person_id)
-    result = await db.execute(query)
-    return result.scalar_one_or_none() is not None
-
-
 async def delete_person(db: AsyncSession, person_id: int, account_id: Optional[int] = None) -> bool:
-    """Delete a person and all related data."""
-    person = await get_person(db, person_id, account_id)
-    if not person:
+    """
+    Delete a person and all related data.
+    
+    Bulk DELETEs children-first (foreign keys are enforced), then the person
+    via DELETE ... RETURNING; no ORM objects are loaded.
+    """
+    person_filter = Person.id == person_id
+    if account_id:
+        person_filter = and_(person_filter, Person.account_id == account_id)
+    
+    # Child rows only for a person that matches the tenant filter
+    person_ids = select(Person.id).where(person_filter)
+    call_ids = select(Call.id).where(Call.person_id.in_(person_ids))
+    for stmt in (
+        delete(Transcript).where(Transcript.call_id.in_(call_ids)),
+        delete(CallAnalysis).where(CallAnalysis.call_id.in_(call_ids)),
+        delete(Call).where(Call.person_id.in_(person_ids)),
+        delete(MemoryState).where(MemoryState.person_id.in_(person_ids)),
+    ):
+        await db.execute(stmt.execution_options(synchronize_session=False))
+    
+    result = await db.execute(
+        delete(Person)
+        .where(person_filter)
+        .returning(Person.account_id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_account_id = result.scalar_one_or_none()
+    if deleted_account_id is None:
+        await db.rollback()
         return False
     
-    await db.delete(person)
+    await refresh_account_counters(db, deleted_account_id)
     await db.commit()
     return True
 
@@ -187,10 +294,30 @@ async def get_calls_with_analysis(
     skip: int = 0,
     limit: int = 100
 ) -> List[Call]:
-    """Get calls with transcript and analysis loaded."""
+    """
+    Get calls with transcript and analysis loaded.
+    
+    Both relationships are one-to-one, so they are outer-joined explicitly into
+    one account-scoped statement (no IN (...) lookups, no parameter limits).
+    Only the analysis columns shown to users are loaded (not memory_update_json).
+    """
     query = (
         select(Call)
-        .options(selectinload(Call.transcript), selectinload(Call.analysis))
+        .outerjoin(Transcript, Transcript.call_id == Call.id)
+        .outerjoin(CallAnalysis, CallAnalysis.call_id == Call.id)
+        .options(
+            contains_eager(Call.transcript),
+            contains_eager(Call.analysis).load_only(
+                CallAnalysis.sentiment_label,
+                CallAnalysis.sentiment_score,
+                CallAnalysis.sentiment_confidence,
+                CallAnalysis.sentiment_reason,
+                CallAnalysis.summary_de
+            ),
+            # Any other relationship access is a bug here: fail loudly instead
+            # of emitting a lazy SELECT (which AsyncSession can't do anyway)
+            raiseload("*")
+        )
         .where(Call.account_id == account_id)
     )
     if person_id:
@@ -200,6 +327,18 @@ async def get_calls_with_analysis(
     return list(result.scalars().all())
 
 
+async def get_sentiment_history(db: AsyncSession, person_id: int, limit: int = 50) -> list:
+    """Get (created_at, sentiment_score, sentiment_label) rows for a person's scored calls, newest first."""
+    result = await db.execute(
+        select(Call.created_at, CallAnalysis.sentiment_score, CallAnalysis.sentiment_label)
+        .join(CallAnalysis, CallAnalysis.call_id == Call.id)
+        .where(and_(Call.person_id == person_id, CallAnalysis.sentiment_score.isnot(None)))
+        .order_by(Call.created_at.desc())
+        .limit(limit)
+    )
+    return list(result.all())
+
+
 async def create_call(db: AsyncSession, call: CallCreate) -> Call:
     """Create a new call record."""
     db_call = Call(
@@ -209,9 +348,17 @@ async def create_call(db: AsyncSession, call: CallCreate) -> Call:
         twilio_call_sid=call.twilio_call_sid,
         from_e164=call.from_e164,
         to_e164=call.to_e164,
-        status="initiated"
+        status=call.status,
+        started_at=call.started_at
     )
     db.add(db_call)
+    await db.flush()
+    await db.execute(
+        update(Account)
+        .where(Account.id == call.account_id)
+        .values(calls_total=Account.calls_total + 1)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
     await db.refresh(db_call)
     return db_call
@@ -219,27 +366,89 @@ async def create_call(db: AsyncSession, call: CallCreate) -> Call:
 
 async def update_call(db: AsyncSession, call_id: int, updates: CallUpdate) -> Optional[Call]:
     """Update call status/times."""
-    call = await get_call(db, call_id)
-    if not call:
-        return None
-    
     update_data = updates.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(call, field, value)
+    if not update_data:
+        return await get_call(db, call_id)
     
+    if "duration_sec" in update_data:
+        await _apply_duration_to_counters(db, Call.id == call_id, update_data["duration_sec"])
+    
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+    result = await db.execute(
+        update(Call).where(Call.id == call_id).values(**update_data).returning(Call),
+        execution_options={"populate_existing": True}
+    )
+    call = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(call)
     return call
 
 
+async def update_call_by_sid(db: AsyncSession, twilio_call_sid: str, updates: CallUpdate) -> Optional[int]:
+    """
+    Update a call addressed by its Twilio SID without loading it first.
+    
+    Status callbacks only write a few columns, so this is a plain UPDATE
+    (no ORM object). Returns the call id, or None if no call matched.
+    """
+    update_data = updates.model_dump(exclude_unset=True)
+    by_sid = Call.twilio_call_sid == twilio_call_sid
+    if not update_data:
+        result = await db.execute(select(Call.id).where(by_sid))
+        return result.scalar_one_or_none()
+    
+    if "duration_sec" in update_data:
+        await _apply_duration_to_counters(db, by_sid, update_data["duration_sec"])
+    
+    result = await db.execute(
+        update(Call).where(by_sid).values(**update_data).returning(Call.id)
+        .execution_options(synchronize_session=False)
+    )
+    call_id = result.scalar_one_or_none()
+    await db.commit()
+    return call_id
+
+
+async def _apply_duration_to_counters(db: AsyncSession, call_filter, duration_sec: Optional[int]) -> None:
+    """
+    Shift the account duration counters from the call's stored duration to the new one.
+    
+    `call_filter` selects the single call being updated. Must run before the
+    call itself is updated; the old value is read in SQL so the adjustment
+    stays atomic within the transaction.
+    """
+    old_duration = select(Call.duration_sec).where(call_filter).scalar_subquery()
+    had_duration = case((old_duration.isnot(None), 1), else_=0)
+    await db.execute(
+        update(Account)
+        .where(Account.id == select(Call.account_id).where(call_filter).scalar_subquery())
+        .values(
+            calls_duration_sum=Account.calls_duration_sum + (duration_sec or 0) - func.coalesce(old_duration, 0),
+            calls_duration_count=Account.calls_duration_count + (1 if duration_sec is not None else 0) - had_duration
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 # ============= Transcript CRUD =============
+# Texts above this size are encrypted/decrypted off the event loop so long
+# transcripts don't stall concurrent media streams
+CRYPTO_OFFLOAD_THRESHOLD = 4096
+
+
+async def _run_crypto(func, text: str) -> str:
+    """Run encrypt_text/decrypt_text inline for short texts, in a worker thread for long ones."""
+    if len(text) > CRYPTO_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(func, text)
+    return func(text)
+
+
 async def create_transcript(db: AsyncSession, call_id: int, text: str, encrypt: bool = True) -> Transcript:
     """Create transcript, optionally encrypted."""
     stored_text = text
     is_encrypted = False
     
-    if encrypt and settings.FERNET_KEY:
-        stored_text = encrypt_text(text)
+    if encrypt and config.ENCRYPTION_ENABLED:
+        stored_text = await _run_crypto(encrypt_text, text)
         is_encrypted = True
     
     transcript = Transcript(
@@ -263,7 +472,7 @@ async def get_transcript(db: AsyncSession, call_id: int) -> Optional[str]:
         return None
     
     if transcript.is_encrypted:
-        return decrypt_text(transcript.text)
+        return await _run_crypto(decrypt_text, transcript.text)
     return transcript.text
 
 
@@ -280,6 +489,16 @@ async def create_analysis(db: AsyncSession, analysis: CallAnalysisCreate) -> Cal
         memory_update_json=analysis.memory_update_json
     )
     db.add(db_analysis)
+    if analysis.sentiment_score is not None:
+        await db.execute(
+            update(Account)
+            .where(Account.id == select(Call.account_id).where(Call.id == analysis.call_id).scalar_subquery())
+            .values(
+                sentiment_sum=Account.sentiment_sum + analysis.sentiment_score,
+                sentiment_count=Account.sentiment_count + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
     await db.commit()
     await db.refresh(db_analysis)
     return db_analysis
@@ -304,84 +523,124 @@ async def get_memory_state(db: AsyncSession, person_id: int) -> Optional[MemoryS
 
 async def update_memory_state(db: AsyncSession, person_id: int, memory_json: dict) -> MemoryState:
     """Update or create memory state."""
-    memory = await get_memory_state(db, person_id)
-    if memory:
-        memory.memory_json = memory_json
-        memory.updated_at = datetime.utcnow()
-    else:
-        memory = MemoryState(person_id=person_id, memory_json=memory_json)
-        db.add(memory)
-    
+    # Upsert: no read needed before the write
+    stmt = _insert(db, MemoryState).values(
+        person_id=person_id,
+        memory_json=memory_json,
+        updated_at=UtcTimestamp()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MemoryState.person_id],
+        set_={
+            "memory_json": stmt.excluded.memory_json,
+            "updated_at": stmt.excluded.updated_at
+        }
+    ).returning(MemoryState)
+    
+    result = await db.execute(stmt, execution_options={"populate_existing": True})
+    memory = result.scalar_one()
     await db.commit()
-    await db.refresh(memory)
     return memory
 
 
 # ============= Statistics =============
+async def _fetch_rows(statement, db: Optional[AsyncSession] = None) -> list:
+    """Run a read-only statement, on its own pooled session unless one is given."""
+    if db is not None:
+        return (await db.execute(statement)).all()
+    async with async_session_maker() as session:
+        return (await session.execute(statement)).all()
+
+
+async def _gather_rows(db: AsyncSession, *statements) -> list[list]:
+    """
+    Run independent read-only statements concurrently.
+    
+    An AsyncSession serializes its statements, so only the first statement runs
+    on the request session; the others get sibling sessions from the pool.
+    """
+    return list(await asyncio.gather(
+        _fetch_rows(statements[0], db),
+        *(_fetch_rows(statement) for statement in statements[1:])
+    ))
+
+
+async def refresh_account_counters(db: AsyncSession, account_id: Optional[int] = None) -> None:
+    """
+    Recompute the pre-aggregated call counters from the calls/analysis tables.
+    
+    Used after bulk deletes and at startup; regular writes adjust the counters
+    incrementally. Does not commit.
+    """
+    account_calls = Call.account_id == Account.id
+    account_sentiments = and_(account_calls, CallAnalysis.call_id == Call.id)
+    stmt = update(Account).values(
+        calls_total=select(func.count(Call.id)).where(account_calls).scalar_subquery(),
+        calls_duration_sum=select(func.coalesce(func.sum(Call.duration_sec), 0))
+        .where(account_calls).scalar_subquery(),
+        calls_duration_count=select(func.count(Call.duration_sec)).where(account_calls).scalar_subquery(),
+        sentiment_sum=select(func.coalesce(func.sum(CallAnalysis.sentiment_score), 0.0))
+        .where(account_sentiments).scalar_subquery(),
+        sentiment_count=select(func.count(CallAnalysis.sentiment_score))
+        .where(account_sentiments).scalar_subquery()
+    )
+    if account_id:
+        stmt = stmt.where(Account.id == account_id)
+    await db.execute(stmt.execution_options(synchronize_session=False))
+
+
 async def get_account_stats(db: AsyncSession, account_id: int) -> dict:
     """Get dashboard statistics for an account."""
-    now = datetime.utcnow()
+    now = utcnow()
     week_ago = now - timedelta(days=7)
-    
-    # Total people
-    people_result = await db.execute(
-        select(func.count(Person.id)).where(Person.account_id == account_id)
-    )
-    total_people = people_result.scalar() or 0
-    
-    # Total calls
-    calls_result = await db.execute(
-        select(func.count(Call.id)).where(Call.account_id == account_id)
-    )
-    total_calls = calls_result.scalar() or 0
-    
-    # Calls this week
-    week_calls_result = await db.execute(
+    trend_start = (now - timedelta(days=6)).replace(hour=0, minute=0, second=0, microsecond=0)
+    day = func.date(Call.created_at).label("day")
+    
+    people_rows, counter_rows, week_rows, trend_rows = await _gather_rows(
+        db,
+        # Total people
+        select(func.count(Person.id)).where(Person.account_id == account_id),
+        # Totals and averages from the pre-aggregated account counters
+        select(
+            Account.calls_total,
+            Account.calls_duration_sum,
+            Account.calls_duration_count,
+            Account.sentiment_sum,
+            Account.sentiment_count
+        ).where(Account.id == account_id),
+        # Calls this week (range scan on ix_calls_account_created)
         select(func.count(Call.id)).where(
             and_(Call.account_id == account_id, Call.created_at >= week_ago)
+        ),
+        # Sentiment trend (last 7 days), grouped by day in a single query
+        select(day, func.avg(CallAnalysis.sentiment_score))
+        .join(CallAnalysis, CallAnalysis.call_id == Call.id)
+        .where(
+            and_(
+                Call.account_id == account_id,
+                Call.created_at >= trend_start,
+                CallAnalysis.sentiment_score.isnot(None)
+            )
         )
+        .group_by(day)
     )
-    calls_this_week = week_calls_result.scalar() or 0
     
-    # Average duration
-    avg_duration_result = await db.execute(
-        select(func.avg(Call.duration_sec)).where(
-            and_(Call.account_id == account_id, Call.duration_sec.isnot(None))
-        )
+    total_people = people_rows[0][0] or 0
+    calls_this_week = week_rows[0][0] or 0
+    total_calls, duration_sum, duration_count, sentiment_sum, sentiment_count = (
+        counter_rows[0] if counter_rows else (0, 0, 0, 0.0, 0)
     )
-    avg_duration = avg_duration_result.scalar()
+    avg_duration = duration_sum / duration_count if duration_count else None
+    avg_sentiment = sentiment_sum / sentiment_count if sentiment_count else None
     
-    # Average sentiment
-    avg_sentiment_result = await db.execute(
-        select(func.avg(CallAnalysis.sentiment_score))
-        .join(Call, CallAnalysis.call_id == Call.id)
-        .where(and_(Call.account_id == account_id, CallAnalysis.sentiment_score.isnot(None)))
-    )
-    avg_sentiment = avg_sentiment_result.scalar()
+    scores_by_day = {str(row_day): score for row_day, score in trend_rows}
     
-    # Sentiment trend (last 7 days)
     sentiment_trend = []
-    for i in range(6, -1, -1):
-        day = now - timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
-        
-        day_sentiment = await db.execute(
-            select(func.avg(CallAnalysis.sentiment_score))
-            .join(Call, CallAnalysis.call_id == Call.id)
-            .where(
-                and_(
-                    Call.account_id == account_id,
-                    Call.created_at >= day_start,
-                    Call.created_at < day_end,
-                    CallAnalysis.sentiment_score.isnot(None)
-                )
-            )
-        )
-        score = day_sentiment.scalar()
+    for i in range(7):
+        day_start = trend_start + timedelta(days=i)
         sentiment_trend.append({
             "date": day_start.isoformat(),
-            "score": score
+            "score": scores_by_day.get(day_start.date().isoformat())
         })
     
     return {
@@ -395,117 +654,117 @@ async def get_account_stats(db: AsyncSession, account_id: int) -> dict:
 
 
 async def get_person_stats(db: AsyncSession, person_id: int) -> dict:
-    """Get statistics for a single person."""
-    now = datetime.utcnow()
-    week_ago = now - timedelta(days=7)
-    
-    # Total calls
-    total_result = await db.execute(
-        select(func.count(Call.id)).where(Call.person_id == person_id)
-    )
-    total_calls = total_result.scalar() or 0
+    """Get statistics for a single person (one aggregate over calls + analyses)."""
+    week_ago = utcnow() - timedelta(days=7)
     
-    # Calls this week
-    week_result = await db.execute(
-        select(func.count(Call.id)).where(
-            and_(Call.person_id == person_id, Call.created_at >= week_ago)
+    result = await db.execute(
+        select(
+            func.count(Call.id).label("total_calls"),
+            func.count(case((Call.created_at >= week_ago, Call.id))).label("calls_this_week"),
+            func.avg(Call.duration_sec).label("avg_duration_sec"),
+            func.max(Call.created_at).label("last_call_at"),
+            func.avg(CallAnalysis.sentiment_score).label("avg_sentiment_score")
         )
+        .outerjoin(CallAnalysis, CallAnalysis.call_id == Call.id)
+        .where(Call.person_id == person_id)
     )
-    calls_this_week = week_result.scalar() or 0
-    
-    # Average duration
-    avg_duration_result = await db.execute(
-        select(func.avg(Call.duration_sec)).where(
-            and_(Call.person_id == person_id, Call.duration_sec.isnot(None))
+    stats = dict(result.mappings().one())
+    stats["total_calls"] = stats["total_calls"] or 0
+    stats["calls_this_week"] = stats["calls_this_week"] or 0
+    return stats
+
+
+# ============= Retention Cleanup =============
+async def _expired_call_ids(db: AsyncSession):
+    """
+    Build a subquery of call ids past their person's retention period,
+    or None when there is nothing to check.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        # Per-person cutoff computed inside SQLite: one correlated statement,
+        # independent of the number of people
+        cutoff = func.datetime("now", func.printf("-%d days", Person.retention_days))
+        return (
+            select(Call.id)
+            .join(Person, Person.id == Call.person_id)
+            .where(Call.created_at < cutoff)
         )
-    )
-    avg_duration = avg_duration_result.scalar()
     
-    # Last call
-    last_call_result = await db.execute(
-        select(Call.created_at)
-        .where(Call.person_id == person_id)
-        .order_by(Call.created_at.desc())
-        .limit(1)
-    )
-    last_call_row = last_call_result.first()
-    last_call_at = last_call_row[0] if last_call_row else None
+    now = utcnow()
     
-    # Average sentiment
-    avg_sentiment_result = await db.execute(
-        select(func.avg(CallAnalysis.sentiment_score))
-        .join(Call, CallAnalysis.call_id == Call.id)
-        .where(and_(Call.person_id == person_id, CallAnalysis.sentiment_score.isnot(None)))
-    )
-    avg_sentiment = avg_sentiment_result.scalar()
+    # Only the two columns needed, no Person objects or JSON decoding
+    people_result = await db.execute(select(Person.id, Person.retention_days))
     
-    return {
-        "total_calls": total_calls,
-        "calls_this_week": calls_this_week,
-        "avg_duration_sec": avg_duration,
-        "last_call_at": last_call_at,
-        "avg_sentiment_score": avg_sentiment
-    }
+    # Group people by retention period so each period needs only one predicate
+    people_by_retention: dict[int, list[int]] = {}
+    for person_id, retention_days in people_result:
+        people_by_retention.setdefault(retention_days, []).append(person_id)
+    
+    if not people_by_retention:
+        return None
+    
+    # Expired calls across all people as a single subquery
+    return select(Call.id).where(
+        or_(*(
+            and_(
+                Call.person_id.in_(person_ids),
+                Call.created_at < now - timedelta(days=retention_days)
+            )
+            for retention_days, person_ids in people_by_retention.items()
+        ))
+    )
 
 
-# ============= Retention Cleanup =============
 async def cleanup_expired_data(db: AsyncSession) -> dict:
     """Delete transcripts and analyses older than retention_days per person."""
-    deleted_transcripts = 0
-    deleted_analyses = 0
-    now = datetime.utcnow()
-    
-    # Get all people with their retention settings
-    people_result = await db.execute(select(Person))
-    people = people_result.scalars().all()
-    
-    for person in people:
-        retention_cutoff = now - timedelta(days=person.retention_days)
-        
-        # Find expired calls
-        expired_calls = await db.execute(
-            select(Call.id).where(
-                and_(
-                    Call.person_id == person.id,
-                    Call.created_at < retention_cutoff
-                )
-            )
-        )
-        expired_call_ids = [row[0] for row in expired_calls.all()]
-        
-        if expired_call_ids:
-            # Delete transcripts
-            for call_id in expired_call_ids:
-                transcript_result = await db.execute(
-                    select(Transcript).where(Transcript.call_id == call_id)
-                )
-                transcript = transcript_result.scalar_one_or_none()
-                if transcript:
-                    await db.delete(transcript)
-                    deleted_transcripts += 1
-                
-                # Delete analysis
-                analysis_result = await db.execute(
-                    select(CallAnalysis).where(CallAnalysis.call_id == call_id)
-                )
-                analysis = analysis_result.scalar_one_or_none()
-                if analysis:
-                    await db.delete(analysis)
-                    deleted_analyses += 1
+    expired_call_ids = await _expired_call_ids(db)
+    if expired_call_ids is None:
+        return {"deleted_transcripts": 0, "deleted_analyses": 0}
+    
+    # Bulk delete transcripts and analyses
+    transcripts_result = await db.execute(
+        delete(Transcript)
+        .where(Transcript.call_id.in_(expired_call_ids))
+        .execution_options(synchronize_session=False)
+    )
+    analyses_result = await db.execute(
+        delete(CallAnalysis)
+        .where(CallAnalysis.call_id.in_(expired_call_ids))
+        .execution_options(synchronize_session=False)
+    )
+    
+    # Removed analyses no longer count towards the sentiment averages
+    await refresh_account_counters(db)
     
     await db.commit()
     
     return {
-        "deleted_transcripts": deleted_transcripts,
-        "deleted_analyses": deleted_analyses
+        "deleted_transcripts": transcripts_result.rowcount,
+        "deleted_analyses": analyses_result.rowcount
     }
 
 
 # ============= Twilio Numbers =============
-async def get_twilio_numbers(db: AsyncSession, account_id: int) -> List[TwilioNumber]:
-    """Get Twilio numbers for an account."""
-    result = await db.execute(
-        select(TwilioNumber).where(TwilioNumber.account_id == account_id)
-    )
-    return list(result.scalars().all())
-
+# Twilio numbers are only provisioned out of band (no write endpoints), so a
+# short per-process TTL is the only invalidation needed. Plain dicts are cached
+# rather than ORM objects so nothing detached or stale is shared across sessions.
+_twilio_numbers_cache = TTLCache(ttl_sec=60)
+
+
+async def get_twilio_numbers(db: AsyncSession, account_id: int) -> List[dict]:
+    """Get Twilio numbers for an account as plain dicts (cached for 60 s)."""
+    numbers = _twilio_numbers_cache.get(account_id)
+    if numbers is None:
+        result = await db.execute(
+            select(
+                TwilioNumber.id,
+                TwilioNumber.account_id,
+                TwilioNumber.phone_e164,
+                TwilioNumber.twilio_sid,
+                TwilioNumber.is_active,
+                TwilioNumber.created_at
+            ).where(TwilioNumber.account_id == account_id)
+        )
+        numbers = [row._asdict() for row in result]
+        _twilio_numbers_cache.set(account_id, numbers)
+    return [dict(number) for number in numbers]
@@ -1,7 +1,13 @@
 """Database setup and session management."""
 import os
+from datetime import datetime, timezone
+from typing import AsyncGenerator
+from sqlalchemy import DateTime, event, func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.config import settings
 
@@ -9,12 +15,51 @@ from app.config import settings
 # Ensure data directory exists
 os.makedirs("data", exist_ok=True)
 
+_is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+
+# The pool is per dialect: sqlite+aiosqlite defaults to NullPool, which
+# rejects the sizing arguments, so SQLite gets an explicit queue pool to
+# apply DB_POOL_SIZE/DB_MAX_OVERFLOW/DB_POOL_TIMEOUT (and report on /health)
+if settings.DB_NULL_POOL:
+    _pool_args = {"poolclass": NullPool}
+else:
+    _pool_args = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    if _is_sqlite:
+        _pool_args["poolclass"] = AsyncAdaptedQueuePool
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
-    future=True
+    future=True,
+    connect_args={"check_same_thread": False, "timeout": 30} if _is_sqlite else {},
+    **_pool_args
 )
 
+# Per-connection SQLite tuning: WAL lets readers run alongside the writer,
+# the rest trades a little durability/memory for fewer fsyncs and disk reads.
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+]
+
+if _is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -23,44 +68,143 @@ async_session_maker = async_sessionmaker(
 
 
 class Base(DeclarativeBase):
-    pass
+    # Timestamps are generated by the database; fetch them back with the
+    # INSERT/UPDATE (RETURNING) instead of expiring the attributes
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime, matching the naive DateTime columns
+    (replacement for the deprecated datetime.utcnow()).
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
+class UtcTimestamp(FunctionElement):
+    """
+    Database-side current timestamp for created_at/updated_at defaults.
+    
+    SQLite's CURRENT_TIMESTAMP only has second precision, which makes rows
+    created in the same second tie in ORDER BY created_at DESC; there the
+    timestamp is rendered with milliseconds instead.
+    """
+    type = DateTime()
+    inherit_cache = True
 
-async def get_db():
-    """Dependency for getting database sessions."""
+
+@compiles(UtcTimestamp)
+def _compile_utc_timestamp(element, compiler, **kw):
+    return compiler.process(func.now(), **kw)
+
+
+@compiles(UtcTimestamp, "sqlite")
+def _compile_utc_timestamp_sqlite(element, compiler, **kw):
+    return compiler.process(func.strftime("%Y-%m-%d %H:%M:%f", "now"), **kw)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting database sessions (closed by the context manager)."""
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+async def in_new_session(func, *args, **kwargs):
+    """Run `func(session, *args, **kwargs)` on a short-lived session of its own."""
+    async with async_session_maker() as session:
+        return await func(session, *args, **kwargs)
+
+
+def get_pool_status() -> str:
+    """Human-readable connection pool state (checked out / overflow)."""
+    return engine.pool.status()
+
+
+async def maintain_database():
+    """
+    Post-cleanup housekeeping for SQLite: truncate the WAL after bulk deletes
+    and refresh planner statistics so the composite indexes keep being used.
+    """
+    if not _is_sqlite:
+        return
+    
+    from sqlalchemy import text
+    
+    async with engine.connect() as conn:
+        await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        await conn.execute(text("ANALYZE"))
+        await conn.commit()
+
+
+# MVP schema additions applied to existing tables (name, SQLite type)
+MIGRATION_COLUMNS = {
+    'people': [
+        ('age', 'INTEGER'),
+        ('personal_context_json', 'TEXT'),  # JSON stored as TEXT in SQLite
+        ('address_json', 'TEXT'),
+        ('updated_at', 'DATETIME'),
+    ],
+    # Dashboard counter columns (backfilled by init_db)
+    'accounts': [
+        ('calls_total', 'BIGINT NOT NULL DEFAULT 0'),
+        ('calls_duration_sum', 'BIGINT NOT NULL DEFAULT 0'),
+        ('calls_duration_count', 'BIGINT NOT NULL DEFAULT 0'),
+        ('sentiment_sum', 'FLOAT NOT NULL DEFAULT 0'),
+        ('sentiment_count', 'BIGINT NOT NULL DEFAULT 0'),
+    ],
+}
+
+# Composite indexes added after the initial schema (create_all skips
+# indexes on tables that already exist)
+MIGRATION_INDEXES = [
+    ('ix_people_account_created', 'people', 'account_id, created_at'),
+    ('ix_calls_account_created', 'calls', 'account_id, created_at'),
+    ('ix_calls_person_created', 'calls', 'person_id, created_at DESC'),
+]
+
+# Inspected schema per table, kept for the lifetime of the process
+_table_columns: dict[str, set[str]] = {}
+_table_indexes: dict[str, set[str]] = {}
+_migrations_applied = False
 
 
 def _migrate_person_table_sync(conn):
     """
-    MVP migration: Add new columns to Person table if they don't exist.
+    MVP migration: Add new columns to the Person and Account tables if they don't exist.
     SQLite does not support IF NOT EXISTS for ALTER TABLE, so we check manually.
+    Each table is inspected at most once per process.
     
     NOTE: This is for MVP only. For production, use Alembic migrations.
     """
     from sqlalchemy import text, inspect
     
-    # Get existing columns
-    inspector = inspect(conn)
-    existing_columns = {col['name'] for col in inspector.get_columns('people')}
+    inspector = None
     
-    # Columns to add (name, type)
-    new_columns = [
-        ('age', 'INTEGER'),
-        ('personal_context_json', 'TEXT'),  # JSON stored as TEXT in SQLite
-        ('address_json', 'TEXT'),
-        ('updated_at', 'DATETIME'),
-    ]
+    for table_name, new_columns in MIGRATION_COLUMNS.items():
+        existing_columns = _table_columns.get(table_name)
+        if existing_columns is None:
+            inspector = inspector or inspect(conn)
+            existing_columns = {col['name'] for col in inspector.get_columns(table_name)}
+            _table_columns[table_name] = existing_columns
+        
+        for col_name, col_type in new_columns:
+            if col_name not in existing_columns:
+                # SQLite ALTER TABLE ADD COLUMN
+                conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN {col_name} {col_type}'))
+                existing_columns.add(col_name)
+                print(f"[Migration] Added column '{table_name}.{col_name}'")
     
-    for col_name, col_type in new_columns:
-        if col_name not in existing_columns:
-            # SQLite ALTER TABLE ADD COLUMN
-            conn.execute(text(f'ALTER TABLE people ADD COLUMN {col_name} {col_type}'))
-            print(f"[Migration] Added column 'people.{col_name}'")
+    for index_name, table_name, columns in MIGRATION_INDEXES:
+        existing_indexes = _table_indexes.get(table_name)
+        if existing_indexes is None:
+            inspector = inspector or inspect(conn)
+            existing_indexes = {ix['name'] for ix in inspector.get_indexes(table_name)}
+            _table_indexes[table_name] = existing_indexes
+        
+        if index_name not in existing_indexes:
+            conn.execute(text(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})'))
+            existing_indexes.add(index_name)
+            print(f"[Migration] Created index '{index_name}'")
 
 
 async def init_db():
@@ -70,12 +214,16 @@ async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    # Run MVP migrations for existing tables
-    async with engine.begin() as conn:
-        try:
-            await conn.run_sync(_migrate_person_table_sync)
-        except Exception as e:
-            print(f"[Migration] Warning: {e}")
+    # Run MVP migrations for existing tables (once per process; disable with
+    # RUN_MIGRATIONS=0 where the schema is managed externally)
+    global _migrations_applied
+    if settings.RUN_MIGRATIONS and not _migrations_applied:
+        async with engine.begin() as conn:
+            try:
+                await conn.run_sync(_migrate_person_table_sync)
+                _migrations_applied = True
+            except Exception as e:
+                print(f"[Migration] Warning: {e}")
     
     # Create default accounts if they don't exist
     async with async_session_maker() as session:
@@ -105,5 +253,11 @@ async def init_db():
             )
             session.add(default_clinical)
         
+        await session.flush()
+        
+        # Recompute dashboard counters so they match the stored calls
+        from app.crud import refresh_account_counters
+        await refresh_account_counters(session)
+        
         await session.commit()
 
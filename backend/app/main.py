@@ -5,19 +5,72 @@ A GDPR-compliant voice companion platform for elderly care,
 using Twilio Media Streams and OpenAI Realtime API.
 """
 import asyncio
+import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.database import init_db
+from app.database import init_db, get_pool_status
 from app.routers import people, dashboard, twilio_webhook
+from app.services.post_call_processor import drain_post_call_tasks
+
+
+LOG_HANDLER_NAME = "app.queue"
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route all log records through a queue so the event loop never blocks on
+    writing to stdout; a listener thread does the actual I/O.
+    
+    Idempotent: a running listener is reused, and a queue handler left on the
+    root logger by an earlier setup (e.g. a re-imported module) is replaced.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(settings.LOG_LEVEL.upper())
+    for handler in [h for h in root.handlers if h.name == LOG_HANDLER_NAME]:
+        root.removeHandler(handler)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.set_name(LOG_HANDLER_NAME)
+    root.addHandler(queue_handler)
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    return _log_listener
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the queue listener and detach its handler from the root logger."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if h.name == LOG_HANDLER_NAME]:
+        root.removeHandler(handler)
+    _log_listener.stop()
+    _log_listener = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan: startup and shutdown."""
     # Startup
+    setup_logging()
     print("Starting EU Voice Companion Backend...")
     await init_db()
     print("Database initialized")
@@ -30,13 +83,16 @@ async def lifespan(app: FastAPI):
     # Shutdown
     cleanup_task.cancel()
     print("Shutting down...")
+    await drain_post_call_tasks()
+    shutdown_logging()
 
 
 app = FastAPI(
     title="EU Voice Companion",
     description="GDPR-compliant voice companion platform for elderly care",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -68,22 +124,31 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check for monitoring."""
-    return {"status": "healthy"}
+    return {"status": "healthy", "db_pool": get_pool_status()}
+
+
+CLEANUP_INTERVAL_SEC = 86400
 
 
 async def run_daily_cleanup():
-    """Background task that runs retention cleanup daily."""
-    from app.database import async_session_maker
+    """Background task that runs retention cleanup at startup and then daily."""
+    from app.database import async_session_maker, maintain_database
     from app import crud
     
+    loop = asyncio.get_running_loop()
+    next_run = loop.time()
+    
     while True:
         try:
-            # Wait 24 hours
-            await asyncio.sleep(86400)
+            # Sleep until the monotonic deadline so delays don't accumulate
+            await asyncio.sleep(max(0, next_run - loop.time()))
+            next_run += CLEANUP_INTERVAL_SEC
             
             async with async_session_maker() as db:
                 result = await crud.cleanup_expired_data(db)
                 print(f"Daily cleanup: {result}")
+            
+            await maintain_database()
                 
         except asyncio.CancelledError:
             break
@@ -93,5 +158,13 @@ async def run_daily_cleanup():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=False
+    )
 
@@ -2,14 +2,18 @@
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
-    String, Integer, Boolean, Float, Text, DateTime, ForeignKey, JSON, Enum
+    String, Integer, BigInteger, Boolean, Float, Text, DateTime, ForeignKey, JSON, Enum, Index, desc, text
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
-from app.database import Base
+from app.database import Base, UtcTimestamp
 from app.config import settings
 
+# Binary JSONB on PostgreSQL (no re-parse on read, GIN-indexable); JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 
 class AccountType(str, enum.Enum):
     PRIVATE = "private"
@@ -42,7 +46,14 @@ class Account(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     type: Mapped[str] = mapped_column(String(20), default="private")
     name: Mapped[str] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcTimestamp())
+    
+    # Pre-aggregated call counters for the dashboard (maintained in crud)
+    calls_total: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    calls_duration_sum: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    calls_duration_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    sentiment_sum: Mapped[float] = mapped_column(Float, default=0.0, server_default="0")
+    sentiment_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
     
     # Relationships
     people: Mapped[list["Person"]] = relationship(back_populates="account", cascade="all, delete-orphan")
@@ -53,6 +64,15 @@ class Account(Base):
 class Person(Base):
     """A senior (private) or patient (clinical) being monitored."""
     __tablename__ = "people"
+    __table_args__ = (
+        # Per-account listings ordered by creation date
+        Index("ix_people_account_created", "account_id", "created_at"),
+        # City lookups via address_json->>'city' (PostgreSQL only; GIN can't serve ->>)
+        Index(
+            "ix_people_address_city", text("(address_json ->> 'city')"),
+            postgresql_where=text("address_json IS NOT NULL")
+        ).ddl_if(dialect="postgresql"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id"), index=True)
@@ -70,8 +90,8 @@ class Person(Base):
     consent_recording: Mapped[bool] = mapped_column(Boolean, default=False)
     retention_days: Mapped[int] = mapped_column(Integer, default=settings.DEFAULT_RETENTION_DAYS)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcTimestamp())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, onupdate=UtcTimestamp())
     
     # Relationships
     account: Mapped["Account"] = relationship(back_populates="people")
@@ -88,7 +108,7 @@ class TwilioNumber(Base):
     phone_e164: Mapped[str] = mapped_column(String(20), unique=True)
     twilio_sid: Mapped[str] = mapped_column(String(100))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcTimestamp())
     
     # Relationships
     account: Mapped["Account"] = relationship(back_populates="twilio_numbers")
@@ -97,6 +117,15 @@ class TwilioNumber(Base):
 class Call(Base):
     """A single phone call record."""
     __tablename__ = "calls"
+    __table_args__ = (
+        # Account/person scoped call lists and time-window stats
+        Index("ix_calls_account_created", "account_id", "created_at"),
+        # Newest-first per person; covering on PostgreSQL for the hot list columns
+        Index(
+            "ix_calls_person_created", "person_id", desc("created_at"),
+            postgresql_include=["account_id", "status"]
+        ),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id"), index=True)
@@ -112,7 +141,7 @@ class Call(Base):
     duration_sec: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     status: Mapped[str] = mapped_column(String(20), default="initiated")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcTimestamp())
     
     # Relationships
     account: Mapped["Account"] = relationship(back_populates="calls")
@@ -132,7 +161,7 @@ class Transcript(Base):
     text: Mapped[str] = mapped_column(Text, default="")
     is_encrypted: Mapped[bool] = mapped_column(Boolean, default=False)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcTimestamp())
     
     # Relationships
     call: Mapped["Call"] = relationship(back_populates="transcript")
@@ -141,6 +170,13 @@ class Transcript(Base):
 class CallAnalysis(Base):
     """Post-call LLM analysis: sentiment, summary, memory updates."""
     __tablename__ = "call_analysis"
+    __table_args__ = (
+        Index(
+            "ix_call_analysis_memory_update_gin", "memory_update_json",
+            postgresql_using="gin",
+            postgresql_ops={"memory_update_json": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     call_id: Mapped[int] = mapped_column(ForeignKey("calls.id"), unique=True, index=True)
@@ -155,9 +191,9 @@ class CallAnalysis(Base):
     summary_de: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Memory update JSON (facts extracted for long-term context)
-    memory_update_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    memory_update_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcTimestamp())
     
     # Relationships
     call: Mapped["Call"] = relationship(back_populates="analysis")
@@ -166,14 +202,22 @@ class CallAnalysis(Base):
 class MemoryState(Base):
     """Long-term context memory for a person (GDPR-minimized)."""
     __tablename__ = "memory_state"
+    __table_args__ = (
+        # Containment (@>) lookups on PostgreSQL; not created on SQLite
+        Index(
+            "ix_memory_state_memory_gin", "memory_json",
+            postgresql_using="gin",
+            postgresql_ops={"memory_json": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     person_id: Mapped[int] = mapped_column(ForeignKey("people.id"), unique=True, index=True)
     
     # Structured memory: facts, preferences, important events, names
-    memory_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    memory_json: Mapped[dict] = mapped_column(JSONDocument, default=dict)
     
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UtcTimestamp(), onupdate=UtcTimestamp())
     
     # Relationships
     person: Mapped["Person"] = relationship(back_populates="memory_state")
@@ -7,17 +7,36 @@ Endpoints:
 - GET  /api/dashboard/settings/private - Private account settings
 - POST /api/dashboard/cleanup          - Manual retention cleanup
 """
+import asyncio
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.config import settings
 from app import crud
+from app.cache import TTLCache
 from app.schemas import DashboardStats, SettingsResponse
 from app.routers.auth import verify_admin_token
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
+# Dashboards are polled by the UI; serve account stats from memory for a few seconds
+_stats_cache = TTLCache(ttl_sec=15, maxsize=8)
+_stats_lock = asyncio.Lock()
+
+
+async def get_cached_account_stats(db: AsyncSession, account_id: int) -> dict:
+    """Account stats, recomputed at most once per TTL (lock avoids a thundering herd)."""
+    stats = _stats_cache.get(account_id)
+    if stats is not None:
+        return stats
+    async with _stats_lock:
+        stats = _stats_cache.get(account_id)
+        if stats is None:
+            stats = await crud.get_account_stats(db, account_id=account_id)
+            _stats_cache.set(account_id, stats)
+    return stats
+
 
 @router.get("/private", response_model=DashboardStats)
 async def get_private_dashboard(
@@ -25,7 +44,7 @@ async def get_private_dashboard(
     _: bool = Depends(verify_admin_token)
 ):
     """Get dashboard stats for private account (seniors)."""
-    stats = await crud.get_account_stats(db, account_id=1)
+    stats = await get_cached_account_stats(db, account_id=1)
     return DashboardStats(**stats)
 
 
@@ -35,7 +54,7 @@ async def get_clinical_dashboard(
     _: bool = Depends(verify_admin_token)
 ):
     """Get dashboard stats for clinical account (patients)."""
-    stats = await crud.get_account_stats(db, account_id=2)
+    stats = await get_cached_account_stats(db, account_id=2)
     return DashboardStats(**stats)
 
 
@@ -47,14 +66,7 @@ async def get_private_settings(
     """Get settings for private account."""
     twilio_numbers = await crud.get_twilio_numbers(db, account_id=1)
     return SettingsResponse(
-        twilio_numbers=[{
-            "id": n.id,
-            "account_id": n.account_id,
-            "phone_e164": n.phone_e164,
-            "twilio_sid": n.twilio_sid,
-            "is_active": n.is_active,
-            "created_at": n.created_at
-        } for n in twilio_numbers],
+        twilio_numbers=twilio_numbers,
         default_consent=False,
         default_retention_days=settings.DEFAULT_RETENTION_DAYS
     )
@@ -67,4 +79,5 @@ async def run_cleanup(
 ):
     """Manually run retention cleanup job."""
     result = await crud.cleanup_expired_data(db)
+    _stats_cache.invalidate()
     return {"message": "Bereinigung abgeschlossen", **result}
@@ -11,12 +11,16 @@ Endpoints:
 - PUT  /api/people/{id}         - Update person
 - DELETE /api/people/{id}       - Delete person
 """
+import asyncio
 import re
 from typing import List, Literal
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import decrypt_texts
+from app.database import get_db, in_new_session
 from app import crud
 from app.schemas import (
     PersonCreate, PersonUpdate, PersonResponse, PersonWithStats,
@@ -29,6 +33,17 @@ router = APIRouter(prefix="/api/people", tags=["people"])
 
 # ============= Helpers =============
 
+# Tenant for each person kind (private account: seniors, clinical account: patients)
+_KIND_ACCOUNT: dict[str, int] = {"senior": 1, "patient": 2}
+
+# Large list pages can be streamed as newline-delimited JSON on request
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_MIN_LIMIT = 100
+
+# Everything except digits and '+' is stripped from phone input
+_PHONE_STRIP = re.compile(r'[^\d+]')
+
+
 def normalize_phone_to_e164(phone: str) -> str:
     """
     Normalize phone number to E.164 format.
@@ -36,7 +51,7 @@ def normalize_phone_to_e164(phone: str) -> str:
     - Converts German 0xxx to +49xxx
     - Returns as-is if already E.164
     """
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _PHONE_STRIP.sub('', phone)
     
     if cleaned.startswith('+'):
         return cleaned
@@ -48,7 +63,11 @@ def normalize_phone_to_e164(phone: str) -> str:
 
 
 def person_to_response(person, stats: dict = None) -> PersonWithStats:
-    """Convert Person model to PersonWithStats response."""
+    """
+    Convert Person model to PersonWithStats response.
+    
+    Values come from typed DB columns/aggregates, so validation is skipped.
+    """
     base = {
         "id": person.id,
         "account_id": person.account_id,
@@ -66,7 +85,19 @@ def person_to_response(person, stats: dict = None) -> PersonWithStats:
     }
     if stats:
         base.update(stats)
-    return PersonWithStats(**base)
+    return PersonWithStats.model_construct(**base)
+
+
+def _row_to_response(row) -> PersonWithStats:
+    """Map a get_people_with_stats row to the response model."""
+    person, total_calls, calls_this_week, avg_duration_sec, last_call_at, avg_sentiment_score = row
+    return person_to_response(person, {
+        "total_calls": total_calls or 0,
+        "calls_this_week": calls_this_week or 0,
+        "avg_duration_sec": avg_duration_sec,
+        "last_call_at": last_call_at,
+        "avg_sentiment_score": avg_sentiment_score
+    })
 
 
 async def list_people_by_kind(
@@ -76,14 +107,28 @@ async def list_people_by_kind(
     limit: int = 100
 ) -> List[PersonWithStats]:
     """List people filtered by kind with stats."""
-    account_id = 1 if kind == "senior" else 2
-    people = await crud.get_people(db, account_id=account_id, kind=kind, skip=skip, limit=limit)
+    account_id = _KIND_ACCOUNT[kind]
+    rows = await crud.get_people_with_stats(db, account_id=account_id, kind=kind, skip=skip, limit=limit)
+    return [_row_to_response(row) for row in rows]
+
+
+def wants_ndjson(request: Request, limit: int) -> bool:
+    """Stream only when the client asks for NDJSON and the page is large."""
+    return limit >= NDJSON_MIN_LIMIT and NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def stream_people_by_kind(
+    kind: Literal["senior", "patient"],
+    skip: int = 0,
+    limit: int = 100
+) -> StreamingResponse:
+    """List people filtered by kind as NDJSON, one person per line."""
+    async def lines():
+        rows = crud.stream_people_with_stats(_KIND_ACCOUNT[kind], kind=kind, skip=skip, limit=limit)
+        async for row in rows:
+            yield orjson.dumps(_row_to_response(row).model_dump()) + b"\n"
     
-    result = []
-    for person in people:
-        stats = await crud.get_person_stats(db, person.id)
-        result.append(person_to_response(person, stats))
-    return result
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
 
 
 async def create_person_with_kind(
@@ -93,39 +138,45 @@ async def create_person_with_kind(
 ) -> PersonResponse:
     """Create a person with specified kind."""
     person.phone_e164 = normalize_phone_to_e164(person.phone_e164)
+    person.kind = kind
+    person.account_id = _KIND_ACCOUNT[kind]
     
-    if await crud.check_phone_exists(db, person.phone_e164):
+    created = await crud.create_person(db, person)
+    if created is None:
         raise HTTPException(
             status_code=409,
             detail=f"Telefonnummer {person.phone_e164} existiert bereits."
         )
-    
-    person.kind = kind
-    person.account_id = 1 if kind == "senior" else 2
-    return await crud.create_person(db, person)
+    return created
 
 
 # ============= List Endpoints =============
 
 @router.get("/seniors", response_model=List[PersonWithStats])
 async def list_seniors(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin_token)
 ):
-    """List all seniors (private account)."""
+    """List all seniors (private account). Send Accept: application/x-ndjson to stream."""
+    if wants_ndjson(request, limit):
+        return stream_people_by_kind("senior", skip, limit)
     return await list_people_by_kind(db, "senior", skip, limit)
 
 
 @router.get("/patients", response_model=List[PersonWithStats])
 async def list_patients(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin_token)
 ):
-    """List all patients (clinical account)."""
+    """List all patients (clinical account). Send Accept: application/x-ndjson to stream."""
+    if wants_ndjson(request, limit):
+        return stream_people_by_kind("patient", skip, limit)
     return await list_people_by_kind(db, "patient", skip, limit)
 
 
@@ -179,17 +230,35 @@ async def get_person_analytics(
     if not person:
         raise HTTPException(status_code=404, detail="Person nicht gefunden")
     
-    # Get calls with analysis
-    calls = await crud.get_calls_with_analysis(db, person.account_id, person_id=person_id, limit=50)
+    # Independent reads run concurrently; an AsyncSession serializes its own
+    # statements, so all but the first get a sibling session from the pool
+    calls, sentiment_rows, memory, stats = await asyncio.gather(
+        crud.get_calls_with_analysis(db, person.account_id, person_id=person_id, limit=50),
+        in_new_session(crud.get_sentiment_history, person_id, limit=50),
+        in_new_session(crud.get_memory_state, person_id),
+        in_new_session(crud.get_person_stats, person_id)
+    )
     
     calls_with_analysis = []
-    sentiment_history = []
     
-    for call in calls:
-        transcript_text = None
-        if call.transcript:
-            from app.config import decrypt_text
-            transcript_text = decrypt_text(call.transcript.text) if call.transcript.is_encrypted else call.transcript.text
+    # Decrypt all transcripts in one batch with the shared Fernet instance
+    transcript_texts = decrypt_texts([
+        (call.transcript.text, call.transcript.is_encrypted) if call.transcript else (None, False)
+        for call in calls
+    ])
+    
+    for call, transcript_text in zip(calls, transcript_texts):
+        analysis = call.analysis
+        if analysis:
+            label, score, confidence, reason, summary = (
+                analysis.sentiment_label,
+                analysis.sentiment_score,
+                analysis.sentiment_confidence,
+                analysis.sentiment_reason,
+                analysis.summary_de
+            )
+        else:
+            label = score = confidence = reason = summary = None
         
         calls_with_analysis.append(CallWithAnalysis(
             id=call.id,
@@ -205,22 +274,18 @@ async def get_person_analytics(
             status=call.status,
             created_at=call.created_at,
             transcript_text=transcript_text,
-            sentiment_label=call.analysis.sentiment_label if call.analysis else None,
-            sentiment_score=call.analysis.sentiment_score if call.analysis else None,
-            sentiment_confidence=call.analysis.sentiment_confidence if call.analysis else None,
-            sentiment_reason=call.analysis.sentiment_reason if call.analysis else None,
-            summary_de=call.analysis.summary_de if call.analysis else None
+            sentiment_label=label,
+            sentiment_score=score,
+            sentiment_confidence=confidence,
+            sentiment_reason=reason,
+            summary_de=summary
         ))
-        
-        if call.analysis and call.analysis.sentiment_score is not None:
-            sentiment_history.append({
-                "date": call.created_at.isoformat(),
-                "score": call.analysis.sentiment_score,
-                "label": call.analysis.sentiment_label
-            })
     
-    memory = await crud.get_memory_state(db, person_id)
-    stats = await crud.get_person_stats(db, person_id)
+    # Sentiment history projected directly in SQL
+    sentiment_history = [
+        {"date": created_at.isoformat(), "score": score, "label": label}
+        for created_at, score, label in sentiment_rows
+    ]
     
     return PersonAnalytics(
         person=PersonResponse(
@@ -7,27 +7,140 @@ Endpoints:
 - POST /twilio/status - Call status callbacks
 - POST /twilio/outbound/call - Initiate outbound call
 """
-import json
 import asyncio
-from datetime import datetime
+import logging
+import orjson
 from typing import Optional
-from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect, Depends
+from urllib.parse import parse_qsl
+from xml.sax.saxutils import escape as xml_escape
+from fastapi import APIRouter, Request, WebSocket, Depends
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from twilio.http.http_client import TwilioHttpClient
+from twilio.rest import Client
 from twilio.twiml.voice_response import VoiceResponse, Connect
 
-from app.database import get_db, async_session_maker
+from app.database import get_db, async_session_maker, in_new_session, utcnow
 from app.config import settings
 from app import crud
+from app.cache import TTLCache
 from app.schemas import CallCreate, CallUpdate
 from app.services.realtime_gateway import RealtimeGateway
-from app.services.post_call_processor import process_call_completion
+from app.services.post_call_processor import schedule_call_completion
 
 router = APIRouter(prefix="/twilio", tags=["twilio"])
 
+logger = logging.getLogger(__name__)
+
+# Closing part of an outbound media frame; see media_prefix in media_stream_handler
+MEDIA_FRAME_SUFFIX = '"}}'
+
+# Upper bound of queued media frames written in one burst by the sender task
+MAX_FRAMES_PER_BURST = 8
+
+# Outbound frames buffered per stream (a few seconds of speech); when the
+# Twilio socket stalls, TTS waits instead of piling audio up in memory
+MAX_QUEUED_FRAMES = 50
+
+# Twilio REST client shared by all requests (created on first use), so its
+# HTTP session keeps the connection to api.twilio.com alive between calls
+_twilio_client: Optional[Client] = None
+
+
+def get_twilio_client() -> Client:
+    """Return the shared Twilio REST client."""
+    global _twilio_client
+    if _twilio_client is None:
+        _twilio_client = Client(
+            settings.TWILIO_ACCOUNT_SID,
+            settings.TWILIO_AUTH_TOKEN,
+            http_client=TwilioHttpClient(pool_connections=True)
+        )
+    return _twilio_client
+
+
+def _build_reject_twiml() -> str:
+    """TwiML for callers whose number is not registered."""
+    response = VoiceResponse()
+    response.say(
+        "Entschuldigung, diese Nummer ist nicht für den Dienst registriert. "
+        "Bitte wenden Sie sich an Ihren Ansprechpartner. Auf Wiederhören.",
+        voice="Polly.Marlene",  # German voice
+        language="de-DE"
+    )
+    response.hangup()
+    return str(response)
+
+
+def _build_stream_twiml(call_sid: str) -> str:
+    """TwiML that connects the call to our WebSocket for bidirectional streaming."""
+    response = VoiceResponse()
+    connect = Connect()
+    connect.stream(
+        url=f"{STREAM_WS_URL}/twilio/stream?call_sid={call_sid}",
+        name="voice-companion-stream"
+    )
+    response.append(connect)
+    return str(response)
+
+
+# TwiML is rendered once at import; voice_webhook only substitutes the call_sid
+STREAM_WS_URL = settings.BASE_URL.replace("http://", "wss://").replace("https://", "wss://")
+CALL_SID_PLACEHOLDER = "__CALL_SID__"
+STREAM_TWIML_TEMPLATE = _build_stream_twiml(CALL_SID_PLACEHOLDER)
+REJECT_TWIML = _build_reject_twiml()
+
+# Caller context looked up by voice_webhook, keyed by call_sid, so the stream
+# "start" event can build the gateway without going back to the database
+# (taken out on read; the TTL drops entries for streams that never start):
+# (person_id, person_name, person_age, personal_context, memory_context)
+_call_bootstrap = TTLCache(ttl_sec=120, maxsize=1024)
+
+
+async def load_call_bootstrap(call_sid: str) -> tuple:
+    """Load caller context for a stream from the database (cache miss path)."""
+    person_id = None
+    person_name = "Anrufer"
+    person_age = None
+    personal_context = {}  # Static profile data (hobbies, sensitivities, etc.)
+    memory_context = {}     # Dynamic memory from conversations
+    
+    call = await in_new_session(crud.get_call_by_sid, call_sid)
+    
+    if call and call.person_id:
+        person_id = call.person_id
+        # Both depend only on person_id; separate sessions so they overlap
+        person, memory = await asyncio.gather(
+            in_new_session(crud.get_person, person_id),
+            in_new_session(crud.get_memory_state, person_id)
+        )
+        if person:
+            person_name = person.display_name
+            person_age = person.age
+            
+            # CRITICAL: Load personal_context_json (hobbies, sensitivities, etc.)
+            if person.personal_context_json:
+                personal_context = person.personal_context_json
+        
+        # Load dynamic memory from conversations
+        if memory and memory.memory_json:
+            memory_context = memory.memory_json
+    
+    return person_id, person_name, person_age, personal_context, memory_context
+
+
+async def read_twilio_form(request: Request) -> dict[str, str]:
+    """
+    Parse a Twilio webhook body. Twilio always posts flat
+    application/x-www-form-urlencoded data, so the multipart form parser
+    is skipped.
+    """
+    body = await request.body()
+    return dict(parse_qsl(body.decode(), keep_blank_values=True))
+
 
 @router.post("/voice")
-async def voice_webhook(request: Request, db: AsyncSession = Depends(get_db)):
+async def voice_webhook(request: Request):
     """
     Twilio Voice webhook - handles incoming calls.
     Returns TwiML to start bidirectional Media Stream.
@@ -41,75 +154,60 @@ async def voice_webhook(request: Request, db: AsyncSession = Depends(get_db)):
     - Select the number and set "Region" to "Ireland (IE1)"
     - This ensures media streams are routed through EU infrastructure
     """
-    form_data = await request.form()
+    form_data = await read_twilio_form(request)
     
     call_sid = form_data.get("CallSid", "")
     from_number = form_data.get("From", "")
     to_number = form_data.get("To", "")
     
-    print(f"[{call_sid}] Incoming call from {from_number}")
-    
-    # Look up caller by phone number
-    person = await crud.get_person_by_phone(db, from_number)
+    logger.info("[%s] Incoming call from %s", call_sid, from_number)
     
-    # ACCESS CONTROL: Reject calls from unknown numbers
-    if not person:
-        print(f"[{call_sid}] REJECTED: Unknown caller {from_number}")
+    # Short session for just the lookups and the insert; it is released
+    # before the TwiML goes out
+    async with async_session_maker() as db:
+        # Look up caller by phone number
+        person = await crud.get_person_by_phone(db, from_number)
         
-        response = VoiceResponse()
-        response.say(
-            "Entschuldigung, diese Nummer ist nicht für den Dienst registriert. "
-            "Bitte wenden Sie sich an Ihren Ansprechpartner. Auf Wiederhören.",
-            voice="Polly.Marlene",  # German voice
-            language="de-DE"
-        )
-        response.hangup()
+        # ACCESS CONTROL: Reject calls from unknown numbers
+        if not person:
+            logger.warning("[%s] REJECTED: Unknown caller %s", call_sid, from_number)
+            
+            return Response(
+                content=REJECT_TWIML,
+                media_type="application/xml"
+            )
         
-        return Response(
-            content=str(response),
-            media_type="application/xml"
-        )
-    
-    print(f"[{call_sid}] Caller identified: {person.display_name} (ID: {person.id})")
-    
-    # Create call record
-    call = await crud.create_call(db, CallCreate(
-        account_id=person.account_id,
-        person_id=person.id,
-        twilio_call_sid=call_sid,
-        direction="inbound",
-        from_e164=from_number,
-        to_e164=to_number
-    ))
+        logger.info("[%s] Caller identified: %s (ID: %s)", call_sid, person.display_name, person.id)
+        
+        # Read before the insert so its commit ends the only transaction
+        memory = await crud.get_memory_state(db, person.id)
+        
+        # Create call record, already in progress (one INSERT, one commit)
+        await crud.create_call(db, CallCreate(
+            account_id=person.account_id,
+            person_id=person.id,
+            twilio_call_sid=call_sid,
+            direction="inbound",
+            from_e164=from_number,
+            to_e164=to_number,
+            status="in_progress",
+            started_at=utcnow()
+        ))
     
-    # Update call status
-    await crud.update_call(db, call.id, CallUpdate(
-        status="in_progress",
-        started_at=datetime.utcnow()
+    # Hand the caller context to the media stream that Twilio opens next
+    _call_bootstrap.set(call_sid, (
+        person.id,
+        person.display_name,
+        person.age,
+        person.personal_context_json or {},
+        (memory.memory_json if memory else None) or {}
     ))
     
-    # Build TwiML response with bidirectional Media Stream
-    response = VoiceResponse()
-    
-    # Connect to our WebSocket for bidirectional streaming
-    connect = Connect()
-    
-    # Build WebSocket URL
-    ws_url = settings.BASE_URL.replace("http://", "wss://").replace("https://", "wss://")
-    stream_url = f"{ws_url}/twilio/stream?call_sid={call_sid}"
-    
-    print(f"[{call_sid}] TwiML WebSocket URL: {stream_url}")
-    
-    # Start bidirectional stream
-    connect.stream(
-        url=stream_url,
-        name="voice-companion-stream"
-    )
-    
-    response.append(connect)
+    # TwiML response with bidirectional Media Stream (only the call_sid varies)
+    logger.debug("[%s] TwiML WebSocket URL: %s/twilio/stream?call_sid=%s", call_sid, STREAM_WS_URL, call_sid)
     
     return Response(
-        content=str(response),
+        content=STREAM_TWIML_TEMPLATE.replace(CALL_SID_PLACEHOLDER, xml_escape(call_sid)),
         media_type="application/xml"
     )
 
@@ -132,13 +230,13 @@ async def media_stream_handler(websocket: WebSocket, call_sid: str = "unknown"):
     - SPEAKING: Streaming TTS audio
     - Barge-in: User interrupts → cancel and return to LISTENING
     """
-    print(f"[{call_sid}] WebSocket connection attempt")
+    logger.debug("[%s] WebSocket connection attempt", call_sid)
     
     try:
         await websocket.accept()
-        print(f"[{call_sid}] WebSocket accepted")
+        logger.debug("[%s] WebSocket accepted", call_sid)
     except Exception as e:
-        print(f"[{call_sid}] Failed to accept WebSocket: {e}")
+        logger.error("[%s] Failed to accept WebSocket: %s", call_sid, e)
         raise
     
     gateway: Optional[RealtimeGateway] = None
@@ -146,9 +244,36 @@ async def media_stream_handler(websocket: WebSocket, call_sid: str = "unknown"):
     actual_call_sid = call_sid  # Will be updated from Twilio "start" event
     person_id: Optional[int] = None
     
+    # Pre-serialized outbound frames (built once stream_sid is known): only the
+    # payload changes per media frame, so no dict/json.dumps per chunk
+    media_prefix = ""
+    clear_frame = ""
+    
+    # Outbound audio goes through a queue drained by one sender task, so bursts
+    # of TTS chunks are written back-to-back instead of one send per callback
+    outbound_frames: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_FRAMES)
+    sender_task: Optional[asyncio.Task] = None
+    
     try:
+        async def pump_outbound_frames():
+            """Drain queued (b64_ulaw, turn_id) chunks to Twilio in bursts."""
+            while True:
+                batch = [await outbound_frames.get()]
+                while len(batch) < MAX_FRAMES_PER_BURST and not outbound_frames.empty():
+                    batch.append(outbound_frames.get_nowait())
+                
+                for b64_ulaw, audio_turn_id in batch:
+                    # Re-check per frame: barge-in may have happened while queued
+                    if not gateway or gateway._cancelled or audio_turn_id != gateway._current_turn_id:
+                        continue
+                    try:
+                        # Base64 needs no JSON escaping, so splice it into the template
+                        await websocket.send_text(media_prefix + b64_ulaw + MEDIA_FRAME_SUFFIX)
+                    except Exception as e:
+                        logger.warning("[%s] Error sending audio: %s", actual_call_sid, e)
+        
         # Callback to send audio to Twilio
-        async def send_audio_to_twilio(b64_ulaw: str, audio_turn_id: int):
+        async def send_audio_to_twilio(b64_ulaw: str, audio_turn_id: int) -> bool:
             """
             Send audio chunk to Twilio.
             
@@ -160,53 +285,29 @@ async def media_stream_handler(websocket: WebSocket, call_sid: str = "unknown"):
             Args:
                 b64_ulaw: Base64 encoded μ-law audio
                 audio_turn_id: The turn ID this audio belongs to
+            
+            Returns:
+                True if the chunk was queued for sending (the gateway then
+                accounts for its playback time)
             """
             if not gateway:
-                return
+                return False
             
             # CRITICAL: Block audio if:
             # 1. Barge-in is active (_cancelled = True)
             # 2. This audio is from an OLD turn (turn ID mismatch)
             if gateway._cancelled:
-                return  # Silently drop - barge-in active
+                return False  # Silently drop - barge-in active
             
             if audio_turn_id != gateway._current_turn_id:
                 # This audio is from a stale turn - discard silently
-                return
+                return False
             
             if stream_sid and b64_ulaw:
-                media_message = {
-                    "event": "media",
-                    "streamSid": stream_sid,
-                    "media": {
-                        "payload": b64_ulaw
-                    }
-                }
-                try:
-                    await websocket.send_text(json.dumps(media_message))
-                    # Track that we've sent audio - needed for barge-in timing
-                    gateway._audio_sent_count += 1
-                    
-                    # CRITICAL: Calculate when this audio will finish playing on Twilio
-                    # μ-law audio: 8kHz sample rate, 1 byte per sample
-                    # base64 decodes to 3/4 of the original length
-                    import time
-                    audio_bytes = len(b64_ulaw) * 3 // 4
-                    audio_duration_sec = audio_bytes / 8000  # 8kHz sample rate
-                    
-                    # CRITICAL FIX: Audio chunks are QUEUED on Twilio, not overlapping!
-                    # Each chunk plays AFTER the previous one finishes.
-                    # So we must ADD the duration, not just take the max!
-                    now = time.time()
-                    
-                    if gateway._audio_playing_until < now:
-                        # No audio in buffer, start from now
-                        gateway._audio_playing_until = now + audio_duration_sec + 0.3
-                    else:
-                        # Audio already in buffer, add this chunk's duration to the end
-                        gateway._audio_playing_until += audio_duration_sec
-                except Exception as e:
-                    print(f"[{actual_call_sid}] Error sending audio: {e}")
+                # Blocks while the queue is full (backpressure to the TTS stream)
+                await outbound_frames.put((b64_ulaw, audio_turn_id))
+                return True
+            return False
         
         # Callback to clear Twilio's audio buffer (for barge-in)
         async def clear_twilio_audio():
@@ -214,118 +315,110 @@ async def media_stream_handler(websocket: WebSocket, call_sid: str = "unknown"):
             Send 'clear' event to Twilio to stop playing buffered audio.
             CRITICAL for barge-in: Without this, already-sent audio keeps playing!
             """
+            # Drop audio that was queued but not yet written
+            while not outbound_frames.empty():
+                outbound_frames.get_nowait()
+            
             if stream_sid:
-                clear_message = {
-                    "event": "clear",
-                    "streamSid": stream_sid
-                }
                 try:
-                    await websocket.send_text(json.dumps(clear_message))
-                    print(f"[{actual_call_sid}] Sent 'clear' event to Twilio")
+                    await websocket.send_text(clear_frame)
+                    logger.debug("[%s] Sent 'clear' event to Twilio", actual_call_sid)
                 except Exception as e:
-                    print(f"[{actual_call_sid}] Error clearing audio: {e}")
+                    logger.warning("[%s] Error clearing audio: %s", actual_call_sid, e)
+        
+        sender_task = asyncio.create_task(pump_outbound_frames())
         
-        # Handle incoming Twilio messages
-        while True:
+        # Handle incoming Twilio messages; iter_text() ends the loop on disconnect
+        async for message in websocket.iter_text():
             try:
-                message = await websocket.receive_text()
-                data = json.loads(message)
-                event_type = data.get("event")
-                
-                if event_type == "connected":
-                    print(f"[{actual_call_sid}] Media stream connected")
+                data = orjson.loads(message)
                 
-                elif event_type == "start":
-                    stream_sid = data.get("streamSid")
-                    start_info = data.get("start", {})
+                # Media frames are ~50/s, so they are matched first; mandatory
+                # fields are indexed directly (malformed frames raise KeyError)
+                match data["event"]:
+                    case "media":
+                        # Forward audio to gateway
+                        if gateway:
+                            payload = data["media"]["payload"]
+                            if payload:
+                                await gateway.receive_audio(payload)
                     
-                    # CRITICAL: Extract actual call_sid from Twilio
-                    actual_call_sid = start_info.get("callSid", call_sid)
+                    case "connected":
+                        logger.debug("[%s] Media stream connected", actual_call_sid)
                     
-                    print(f"[{actual_call_sid}] Stream started: {stream_sid}")
-                    print(f"[{actual_call_sid}] Media format: {start_info.get('mediaFormat', {})}")
-                    
-                    # NOW load call and person info with the correct call_sid
-                    person_name = "Anrufer"
-                    person_age = None
-                    personal_context = {}  # Static profile data (hobbies, sensitivities, etc.)
-                    memory_context = {}     # Dynamic memory from conversations
-                    
-                    async with async_session_maker() as db:
-                        call = await crud.get_call_by_sid(db, actual_call_sid)
+                    case "start":
+                        stream_sid = data.get("streamSid")
+                        start_info = data.get("start", {})
+                        media_prefix = orjson.dumps({"event": "media", "streamSid": stream_sid}).decode()[:-1] + ',"media":{"payload":"'
+                        clear_frame = orjson.dumps({"event": "clear", "streamSid": stream_sid}).decode()
                         
-                        if call and call.person_id:
-                            person_id = call.person_id
-                            person = await crud.get_person(db, person_id)
-                            if person:
-                                person_name = person.display_name
-                                person_age = person.age
-                                
-                                # CRITICAL: Load personal_context_json (hobbies, sensitivities, etc.)
-                                if person.personal_context_json:
-                                    personal_context = person.personal_context_json
-                                    print(f"[{actual_call_sid}] Loaded personal context for {person_name}: {list(personal_context.keys())}")
-                            
-                            # Load dynamic memory from conversations
-                            memory = await crud.get_memory_state(db, person_id)
-                            if memory and memory.memory_json:
-                                memory_context = memory.memory_json
-                                print(f"[{actual_call_sid}] Loaded memory for {person_name}: {list(memory_context.keys())}")
-                    
-                    # Initialize gateway with correct call_sid, profile, and memory
-                    gateway = RealtimeGateway(
-                        call_sid=actual_call_sid,
-                        person_name=person_name,
-                        person_age=person_age,
-                        personal_context=personal_context,
-                        memory_context=memory_context,
-                        on_audio_out=send_audio_to_twilio,
-                        on_clear_audio=clear_twilio_audio
-                    )
-                    
-                    # Start gateway (connects to Deepgram, initializes LLM and TTS)
-                    await gateway.start()
+                        # CRITICAL: Extract actual call_sid from Twilio
+                        actual_call_sid = start_info.get("callSid", call_sid)
+                        
+                        logger.info("[%s] Stream started: %s", actual_call_sid, stream_sid)
+                        logger.debug("[%s] Media format: %s", actual_call_sid, start_info.get("mediaFormat"))
+                        
+                        # NOW load call and person info with the correct call_sid,
+                        # from what voice_webhook cached or from the DB on a miss
+                        bootstrap = _call_bootstrap.pop(actual_call_sid)
+                        if bootstrap is None:
+                            bootstrap = await load_call_bootstrap(actual_call_sid)
+                        person_id, person_name, person_age, personal_context, memory_context = bootstrap
+                        
+                        if personal_context:
+                            logger.debug("[%s] Loaded personal context for %s: %s", actual_call_sid, person_name, list(personal_context))
+                        if memory_context:
+                            logger.debug("[%s] Loaded memory for %s: %s", actual_call_sid, person_name, list(memory_context))
+                        
+                        # Initialize gateway with correct call_sid, profile, and memory
+                        gateway = RealtimeGateway(
+                            call_sid=actual_call_sid,
+                            person_name=person_name,
+                            person_age=person_age,
+                            personal_context=personal_context,
+                            memory_context=memory_context,
+                            on_audio_out=send_audio_to_twilio,
+                            on_clear_audio=clear_twilio_audio
+                        )
+                        
+                        # Start gateway (connects to Deepgram, initializes LLM and TTS)
+                        await gateway.start()
+                        
+                        # Send initial greeting
+                        await gateway.send_initial_greeting()
                     
-                    # Send initial greeting
-                    await gateway.send_initial_greeting()
-                
-                elif event_type == "media":
-                    # Forward audio to gateway
-                    if gateway:
-                        payload = data.get("media", {}).get("payload", "")
-                        if payload:
-                            await gateway.receive_audio(payload)
-                
-                elif event_type == "stop":
-                    print(f"[{actual_call_sid}] Stream stop received")
-                    break
+                    case "stop":
+                        logger.info("[%s] Stream stop received", actual_call_sid)
+                        break
                     
-            except WebSocketDisconnect:
-                print(f"[{actual_call_sid}] WebSocket disconnected")
-                break
+            except KeyError as e:
+                logger.warning("[%s] Ignoring malformed stream frame (missing %s)", actual_call_sid, e)
             except Exception as e:
-                print(f"[{actual_call_sid}] Error processing message: {e}")
+                logger.error("[%s] Error processing message: %s", actual_call_sid, e)
                 break
+        else:
+            logger.info("[%s] WebSocket disconnected", actual_call_sid)
         
     except Exception as e:
-        print(f"[{actual_call_sid}] Stream error: {e}")
+        logger.error("[%s] Stream error: %s", actual_call_sid, e)
     
     finally:
         # Cleanup
         full_transcript = ""
         
+        if sender_task:
+            sender_task.cancel()
+        
         if gateway:
             full_transcript = gateway.get_full_transcript()
             await gateway.stop()
         
         # Process call completion in background with correct call_sid
         if full_transcript and actual_call_sid != "unknown":
-            print(f"[{actual_call_sid}] Starting post-call processing with {len(full_transcript)} chars")
-            asyncio.create_task(
-                process_call_completion(actual_call_sid, full_transcript)
-            )
+            logger.info("[%s] Starting post-call processing with %d chars", actual_call_sid, len(full_transcript))
+            schedule_call_completion(actual_call_sid, full_transcript)
         
-        print(f"[{actual_call_sid}] WebSocket handler complete")
+        logger.debug("[%s] WebSocket handler complete", actual_call_sid)
 
 
 @router.post("/status")
@@ -334,25 +427,24 @@ async def status_callback(request: Request):
     Twilio status callback for call events.
     Updates call status in database.
     """
-    form_data = await request.form()
+    form_data = await read_twilio_form(request)
     
     call_sid = form_data.get("CallSid", "")
     call_status = form_data.get("CallStatus", "")
     duration = form_data.get("CallDuration")
     
-    print(f"[{call_sid}] Status callback: {call_status}")
+    logger.info("[%s] Status callback: %s", call_sid, call_status)
     
+    updates = CallUpdate(status=call_status)
+    
+    if call_status == "completed":
+        updates.ended_at = utcnow()
+        if duration:
+            updates.duration_sec = int(duration)
+    
+    # One UPDATE by SID; callbacks for unknown calls simply match no row
     async with async_session_maker() as db:
-        call = await crud.get_call_by_sid(db, call_sid)
-        if call:
-            updates = CallUpdate(status=call_status)
-            
-            if call_status == "completed":
-                updates.ended_at = datetime.utcnow()
-                if duration:
-                    updates.duration_sec = int(duration)
-            
-            await crud.update_call(db, call.id, updates)
+        await crud.update_call_by_sid(db, call_sid, updates)
     
     return {"status": "ok"}
 
@@ -366,8 +458,6 @@ async def initiate_outbound_call(
     Initiate an outbound call to a person.
     Useful for testing without scheduling.
     """
-    from twilio.rest import Client
-    
     person = await crud.get_person(db, person_id)
     if not person:
         return {"error": "Person nicht gefunden"}
@@ -375,14 +465,17 @@ async def initiate_outbound_call(
     if not settings.TWILIO_ACCOUNT_SID or not settings.TWILIO_AUTH_TOKEN:
         return {"error": "Twilio nicht konfiguriert"}
     
-    client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+    client = get_twilio_client()
     
     # Build webhook URL
     webhook_url = f"{settings.BASE_URL}/twilio/voice"
     status_url = f"{settings.BASE_URL}/twilio/status"
     
     try:
-        call = client.calls.create(
+        # The Twilio SDK is synchronous; run it in a worker thread so active
+        # media streams keep being served while the API request is in flight
+        call = await asyncio.to_thread(
+            client.calls.create,
             to=person.phone_e164,
             from_=settings.TWILIO_NUMBER_E164,
             url=webhook_url,
@@ -1,7 +1,7 @@
 """Pydantic schemas for API request/response validation."""
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============= Account Schemas =============
@@ -18,8 +18,7 @@ class AccountResponse(AccountBase):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Person Schemas =============
@@ -103,8 +102,7 @@ class PersonResponse(PersonBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PersonWithStats(PersonResponse):
@@ -127,6 +125,8 @@ class CallCreate(CallBase):
     account_id: int
     person_id: Optional[int] = None
     twilio_call_sid: str
+    status: str = "initiated"
+    started_at: Optional[datetime] = None
 
 
 class CallUpdate(BaseModel):
@@ -147,8 +147,7 @@ class CallResponse(CallBase):
     status: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CallWithAnalysis(CallResponse):
@@ -173,8 +172,7 @@ class TranscriptResponse(BaseModel):
     text: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Analysis Schemas =============
@@ -207,8 +205,7 @@ class CallAnalysisResponse(BaseModel):
     memory_update_json: Optional[dict]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Memory Schemas =============
@@ -218,8 +215,7 @@ class MemoryStateResponse(BaseModel):
     memory_json: dict
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Dashboard Schemas =============
@@ -253,8 +249,7 @@ class TwilioNumberResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============= Settings Schemas =============
@@ -2,11 +2,12 @@
 Audio format conversion utilities for Twilio Media Streams.
 
 Twilio sends: μ-law (G.711 PCMU) at 8kHz, base64 encoded
-Deepgram needs: PCM 16-bit at 8kHz
+Deepgram accepts: μ-law 8kHz directly (no conversion needed)
 ElevenLabs outputs: μ-law 8kHz directly (no conversion needed)
+Local barge-in VAD needs: PCM 16-bit at 8kHz (decoded only while it runs)
 """
-import base64
-import struct
+import numpy as np
+import pybase64
 
 
 # μ-law to linear PCM conversion table (ITU-T G.711)
@@ -38,15 +39,35 @@ def _build_ulaw_table():
 # Build table on module load
 _build_ulaw_table()
 
+# Same table as a little-endian int16 array, so a whole frame is converted
+# with one vectorized gather instead of a per-sample Python loop
+MULAW_TO_PCM16 = np.array(ULAW_TO_PCM_TABLE, dtype='<i2')
+
 
 def ulaw_to_pcm(ulaw_bytes: bytes) -> bytes:
     """Convert μ-law audio to 16-bit PCM."""
-    pcm_samples = [ULAW_TO_PCM_TABLE[byte] for byte in ulaw_bytes]
-    return struct.pack(f'<{len(pcm_samples)}h', *pcm_samples)
+    return MULAW_TO_PCM16[np.frombuffer(ulaw_bytes, dtype=np.uint8)].tobytes()
+
+
+# μ-law codes for +0 and -0; frames made only of these are digital silence
+ULAW_SILENCE_BYTES = b'\xff\x7f'
+
+
+def is_ulaw_silence(ulaw_bytes: bytes) -> bool:
+    """True if a μ-law frame is pure digital silence (no decode needed)."""
+    return not ulaw_bytes.strip(ULAW_SILENCE_BYTES)
 
 
 def base64_ulaw_to_pcm(b64_ulaw: str) -> bytes:
     """Convert base64-encoded μ-law (from Twilio) to PCM bytes (for Deepgram)."""
-    ulaw_bytes = base64.b64decode(b64_ulaw)
+    ulaw_bytes = pybase64.b64decode(b64_ulaw)
     return ulaw_to_pcm(ulaw_bytes)
 
+
+def pcm_rms(pcm_bytes: bytes) -> float:
+    """RMS energy of 16-bit little-endian PCM (0-32767 range); 0.0 if empty."""
+    num_samples = len(pcm_bytes) // 2
+    if not num_samples:
+        return 0.0
+    samples = np.frombuffer(pcm_bytes, dtype='<i2', count=num_samples).astype(np.float64)
+    return float(np.sqrt(np.dot(samples, samples) / num_samples))
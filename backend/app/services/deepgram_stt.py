@@ -9,22 +9,30 @@ Provides real-time speech-to-text with:
 - German language support
 
 Audio Format:
-- Input: PCM 16-bit signed little-endian
+- Input: μ-law (G.711 PCMU), forwarded exactly as Twilio sends it
 - Sample rate: 8000 Hz (Twilio native, no resampling needed)
 - Channels: Mono
 """
 import asyncio
-import json
+import logging
 import time
 from typing import Optional, Callable, Awaitable
 from dataclasses import dataclass
+import orjson
 import websockets
 from websockets.client import WebSocketClientProtocol
 
 from app.config import settings
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Control messages are constant, so they are serialized once (sent as text frames)
+KEEP_ALIVE_MESSAGE = orjson.dumps({"type": "KeepAlive"}).decode()
+CLOSE_STREAM_MESSAGE = orjson.dumps({"type": "CloseStream"}).decode()
+
+
+@dataclass(slots=True, frozen=True)
 class TranscriptEvent:
     """Represents a transcript event from Deepgram."""
     text: str
@@ -84,7 +92,7 @@ class DeepgramSTT:
             True if connected successfully
         """
         if not settings.DEEPGRAM_API_KEY:
-            print(f"[{self.call_sid}] Deepgram API key not configured")
+            logger.error("[%s] Deepgram API key not configured", self.call_sid)
             return False
         
         # Build URL with query parameters (Deepgram Nova-2 API)
@@ -98,7 +106,7 @@ class DeepgramSTT:
         params = {
             "model": "nova-2",
             "language": "de",
-            "encoding": "linear16",
+            "encoding": "mulaw",  # Twilio's wire format, no PCM conversion
             "sample_rate": "8000",
             "channels": "1",
             "punctuate": "true",
@@ -111,7 +119,7 @@ class DeepgramSTT:
         query_string = "&".join(f"{k}={v}" for k, v in params.items())
         url = f"{self.DEEPGRAM_WS_URL}?{query_string}"
         
-        print(f"[{self.call_sid}] Connecting to Deepgram: {url}")
+        logger.debug("[%s] Connecting to Deepgram: %s", self.call_sid, url)
         
         headers = {
             "Authorization": f"Token {settings.DEEPGRAM_API_KEY}"
@@ -121,11 +129,12 @@ class DeepgramSTT:
             self.ws = await websockets.connect(
                 url,
                 extra_headers=headers,
+                compression=None,  # Audio frames don't compress; skip zlib per frame
                 ping_interval=20,
                 ping_timeout=10
             )
             self.connected = True
-            print(f"[{self.call_sid}] Connected to Deepgram STT")
+            logger.info("[%s] Connected to Deepgram STT", self.call_sid)
             
             # Start receive loop
             self._receive_task = asyncio.create_task(self._receive_loop())
@@ -136,24 +145,24 @@ class DeepgramSTT:
             return True
             
         except Exception as e:
-            print(f"[{self.call_sid}] Failed to connect to Deepgram: {e}")
+            logger.error("[%s] Failed to connect to Deepgram: %s", self.call_sid, e)
             return False
     
-    async def send_audio(self, pcm_bytes: bytes):
+    async def send_audio(self, ulaw_bytes: bytes):
         """
-        Send PCM audio to Deepgram.
+        Send μ-law audio to Deepgram.
         
         Args:
-            pcm_bytes: PCM 16-bit audio at 8000 Hz
+            ulaw_bytes: μ-law audio at 8000 Hz
         """
         if not self.connected or not self.ws:
             return
         
         try:
-            await self.ws.send(pcm_bytes)
+            await self.ws.send(ulaw_bytes)
             self.last_audio_time = time.time()
         except Exception as e:
-            print(f"[{self.call_sid}] Error sending audio to Deepgram: {e}")
+            logger.warning("[%s] Error sending audio to Deepgram: %s", self.call_sid, e)
     
     async def _receive_loop(self):
         """Background loop to receive transcripts from Deepgram."""
@@ -163,15 +172,15 @@ class DeepgramSTT:
         try:
             async for message in self.ws:
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     await self._handle_message(data)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
                     
         except websockets.exceptions.ConnectionClosed:
-            print(f"[{self.call_sid}] Deepgram connection closed")
+            logger.info("[%s] Deepgram connection closed", self.call_sid)
         except Exception as e:
-            print(f"[{self.call_sid}] Deepgram receive error: {e}")
+            logger.error("[%s] Deepgram receive error: %s", self.call_sid, e)
         finally:
             self.connected = False
     
@@ -186,7 +195,7 @@ class DeepgramSTT:
             
             # Log speech_final for debugging turn detection
             if speech_final:
-                print(f"[{self.call_sid}] Deepgram speech_final=True received!")
+                logger.debug("[%s] Deepgram speech_final=True received!", self.call_sid)
             
             # Transcript result
             channel = data.get("channel", {})
@@ -219,7 +228,7 @@ class DeepgramSTT:
                 if text:
                     if is_final:
                         self.final_count += 1
-                        print(f"[{self.call_sid}] STT Final: {text}")
+                        logger.debug("[%s] STT Final: %s", self.call_sid, text)
                     else:
                         self.partial_count += 1
                 
@@ -228,7 +237,7 @@ class DeepgramSTT:
         
         elif msg_type == "UtteranceEnd":
             # End of utterance detected
-            print(f"[{self.call_sid}] Deepgram: Utterance end detected")
+            logger.debug("[%s] Deepgram: Utterance end detected", self.call_sid)
             
             # Send a synthetic event to signal turn complete
             if self.on_transcript:
@@ -243,17 +252,17 @@ class DeepgramSTT:
                 await self.on_transcript(event)
         
         elif msg_type == "SpeechStarted":
-            print(f"[{self.call_sid}] Deepgram: Speech started")
+            logger.debug("[%s] Deepgram: Speech started", self.call_sid)
             # Trigger barge-in callback immediately - this is faster than waiting for transcripts!
             if self.on_speech_started:
                 await self.on_speech_started()
         
         elif msg_type == "Metadata":
             # Connection metadata
-            print(f"[{self.call_sid}] Deepgram metadata: {data.get('model_info', {}).get('name', 'unknown')}")
+            logger.debug("[%s] Deepgram metadata: %s", self.call_sid, data.get('model_info', {}).get('name', 'unknown'))
         
         elif msg_type == "Error":
-            print(f"[{self.call_sid}] Deepgram error: {data}")
+            logger.error("[%s] Deepgram error: %s", self.call_sid, data)
     
     async def _keep_alive_loop(self):
         """Send keep-alive messages to prevent timeout."""
@@ -264,7 +273,7 @@ class DeepgramSTT:
                 if self.ws and self.connected:
                     # Send keep-alive (empty JSON)
                     try:
-                        await self.ws.send(json.dumps({"type": "KeepAlive"}))
+                        await self.ws.send(KEEP_ALIVE_MESSAGE)
                     except Exception:
                         pass
                         
@@ -276,7 +285,7 @@ class DeepgramSTT:
         if self.ws and self.connected:
             try:
                 # Send close stream message
-                await self.ws.send(json.dumps({"type": "CloseStream"}))
+                await self.ws.send(CLOSE_STREAM_MESSAGE)
                 # Give time for final results
                 await asyncio.sleep(0.5)
             except Exception:
@@ -307,5 +316,5 @@ class DeepgramSTT:
                 pass
             self.ws = None
         
-        print(f"[{self.call_sid}] Deepgram disconnected (partials: {self.partial_count}, finals: {self.final_count})")
+        logger.info("[%s] Deepgram disconnected (partials: %s, finals: %s)", self.call_sid, self.partial_count, self.final_count)
 
@@ -14,12 +14,44 @@ Best Practices Applied:
 """
 import asyncio
 import aiohttp
+import pybase64
 import re
 from typing import Optional, Callable, Awaitable
 
 from app.config import settings
 
 
+# Text preprocessing patterns, compiled once instead of per TTS request
+_RE_NUMBER = re.compile(r'\b(\d+)\b')
+_RE_BRACKETS = re.compile(r'\[.*?\]')
+_RE_NON_TEXT = re.compile(r'[^\w\s.,!?äöüÄÖÜß\-]')
+_RE_PUNCT_GAP = re.compile(r'([.,!?])([A-ZÄÖÜa-zäöü])')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+class _TextCharFilter(dict):
+    """
+    str.translate table that deletes everything _RE_NON_TEXT matches.
+    
+    Code points are classified with the regex on first sight and memoized,
+    so filtering is a single C-level pass over the text.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        keep = None if _RE_NON_TEXT.match(chr(codepoint)) else codepoint
+        self[codepoint] = keep
+        return keep
+
+
+_TEXT_CHAR_FILTER = _TextCharFilter()
+
+# German conjunctions that are natural break points
+_CONJUNCTIONS = ('und', 'aber', 'oder', 'denn', 'weil', 'dass', 'wenn', 'obwohl', 'während')
+_CONJUNCTION_SET = frozenset(_CONJUNCTIONS)
+_RE_CONJUNCTION_SPLIT = re.compile(rf'(\b({"|".join(_CONJUNCTIONS)})\b)', re.IGNORECASE)
+
+
 class ElevenLabsTTS:
     """
     Streaming TTS client using ElevenLabs, optimized for voice "Theresa".
@@ -33,6 +65,10 @@ class ElevenLabsTTS:
     
     ELEVENLABS_API_URL = "https://api.elevenlabs.io/v1"
     
+    # Smallest μ-law chunk handed to on_audio (40ms at 8kHz); smaller network
+    # reads are staged and sent together as one Twilio media frame
+    MIN_MEDIA_CHUNK_BYTES = 320
+    
     # Theresa-specific tuning: max words per sentence before considering a split
     MAX_WORDS_PER_CHUNK = 20
     
@@ -103,7 +139,7 @@ class ElevenLabsTTS:
                 return num
         
         # Match standalone numbers (not part of a word)
-        return re.sub(r'\b(\d+)\b', replace_number, text)
+        return _RE_NUMBER.sub(replace_number, text)
     
     def _preprocess_text_for_lea(self, text: str) -> str:
         """
@@ -131,8 +167,8 @@ class ElevenLabsTTS:
         text = self._convert_numbers_to_german(text)
         
         # Remove any stage directions or emojis that might have slipped through
-        text = re.sub(r'\[.*?\]', '', text)  # Remove [brackets]
-        text = re.sub(r'[^\w\s.,!?äöüÄÖÜß\-]', '', text)  # Keep only text chars
+        text = _RE_BRACKETS.sub('', text)  # Remove [brackets]
+        text = text.translate(_TEXT_CHAR_FILTER)  # Keep only text chars
         
         # Split very long sentences on German conjunctions for breathing pauses
         # Only split if sentence is getting too long (>20 words)
@@ -141,10 +177,10 @@ class ElevenLabsTTS:
             text = self._split_long_sentences(text)
         
         # Ensure proper spacing after punctuation
-        text = re.sub(r'([.,!?])([A-ZÄÖÜa-zäöü])', r'\1 \2', text)
+        text = _RE_PUNCT_GAP.sub(r'\1 \2', text)
         
         # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _RE_WHITESPACE.sub(' ', text).strip()
         
         return text
     
@@ -161,18 +197,15 @@ class ElevenLabsTTS:
         Returns:
             Text with natural break points added
         """
-        # German conjunctions that are natural break points
-        conjunctions = r'\b(und|aber|oder|denn|weil|dass|wenn|obwohl|während)\b'
-        
         result = []
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _RE_SENTENCE_END.split(text)
         
         for sentence in sentences:
             words = sentence.split()
             if len(words) > self.MAX_WORDS_PER_CHUNK:
                 # Find conjunction near the middle and add comma before it
                 # This creates a natural breathing pause
-                parts = re.split(f'({conjunctions})', sentence, flags=re.IGNORECASE)
+                parts = _RE_CONJUNCTION_SPLIT.split(sentence)
                 if len(parts) > 1:
                     rebuilt = []
                     word_count = 0
@@ -182,7 +215,7 @@ class ElevenLabsTTS:
                         
                         # Add comma pause before conjunction if we're past halfway
                         if (word_count > self.MAX_WORDS_PER_CHUNK // 2 and 
-                            part.lower().strip() in ['und', 'aber', 'oder', 'denn', 'weil', 'dass', 'wenn', 'obwohl', 'während']):
+                            part.lower().strip() in _CONJUNCTION_SET):
                             rebuilt.append(',')
                         rebuilt.append(part)
                     sentence = ''.join(rebuilt)
@@ -200,7 +233,8 @@ class ElevenLabsTTS:
     async def synthesize_streaming(
         self,
         text: str,
-        on_audio: Optional[Callable[[bytes], Awaitable[None]]] = None
+        on_audio: Optional[Callable[[bytes], Awaitable[None]]] = None,
+        collect: bool = True
     ) -> bytes:
         """
         Synthesize text to speech with streaming.
@@ -208,6 +242,7 @@ class ElevenLabsTTS:
         Args:
             text: Text to synthesize
             on_audio: Callback for each audio chunk (PCM 8kHz bytes)
+            collect: Keep the complete audio for the return value (b"" otherwise)
             
         Returns:
             Complete audio as PCM 8kHz bytes
@@ -275,7 +310,8 @@ class ElevenLabsTTS:
             "optimize_streaming_latency": "4"  # Maximum optimization
         }
         
-        all_audio = b""
+        all_audio = bytearray()
+        total_bytes = 0
         
         try:
             session = await self._get_session()
@@ -297,7 +333,9 @@ class ElevenLabsTTS:
                         break
                     
                     if chunk:
-                        all_audio += chunk
+                        if collect:
+                            all_audio.extend(chunk)
+                        total_bytes += len(chunk)
                         self.total_chunks += 1
                         
                         if on_audio and not self._cancelled:
@@ -306,8 +344,8 @@ class ElevenLabsTTS:
                 self._current_response = None
             
             if not self._cancelled:
-                print(f"[{self.call_sid}] TTS complete: '{text[:50]}...' -> {len(all_audio)} bytes")
-            return all_audio
+                print(f"[{self.call_sid}] TTS complete: '{text[:50]}...' -> {total_bytes} bytes")
+            return bytes(all_audio)
             
         except asyncio.CancelledError:
             print(f"[{self.call_sid}] TTS task cancelled")
@@ -321,34 +359,52 @@ class ElevenLabsTTS:
     async def synthesize_to_ulaw(
         self,
         text: str,
-        on_audio: Optional[Callable[[str], Awaitable[None]]] = None
+        on_audio: Optional[Callable[[str, int], Awaitable[None]]] = None,
+        collect: bool = False
     ) -> str:
         """
         Synthesize text to base64 μ-law for Twilio.
         
         ElevenLabs now outputs μ-law 8kHz directly, so we just base64 encode.
+        Short network reads are coalesced to at least MIN_MEDIA_CHUNK_BYTES
+        per callback.
         
         Args:
             text: Text to synthesize
-            on_audio: Callback for each audio chunk (base64 μ-law)
+            on_audio: Callback for each audio chunk (base64 μ-law, raw μ-law byte count)
+            collect: Also build the complete audio for the return value; off by
+                default since streaming callers only use on_audio
             
         Returns:
-            Complete audio as base64 μ-law
+            Complete audio as base64 μ-law if collect is set, otherwise ""
         """
-        import base64
+        all_ulaw = bytearray()
+        staged = bytearray()
         
-        all_ulaw_b64 = ""
-        
-        async def on_ulaw_chunk(ulaw_chunk: bytes):
-            nonlocal all_ulaw_b64
+        async def emit(ulaw_chunk: bytes):
+            if collect:
+                all_ulaw.extend(ulaw_chunk)
             # Already μ-law, just base64 encode for Twilio
-            ulaw_b64 = base64.b64encode(ulaw_chunk).decode('ascii')
-            all_ulaw_b64 += ulaw_b64
+            ulaw_b64 = pybase64.b64encode_as_string(ulaw_chunk)
             if on_audio:
-                await on_audio(ulaw_b64)
+                await on_audio(ulaw_b64, len(ulaw_chunk))
         
-        await self.synthesize_streaming(text, on_ulaw_chunk)
-        return all_ulaw_b64
+        async def on_ulaw_chunk(ulaw_chunk: bytes):
+            staged.extend(ulaw_chunk)
+            if len(staged) >= self.MIN_MEDIA_CHUNK_BYTES:
+                ulaw_frame = bytes(staged)
+                staged.clear()
+                await emit(ulaw_frame)
+        
+        await self.synthesize_streaming(text, on_ulaw_chunk, collect=False)
+        
+        # Flush the tail of the utterance (dropped on barge-in)
+        if staged and not self._cancelled:
+            await emit(bytes(staged))
+        if not collect:
+            return ""
+        # Encoded in one piece: per-chunk base64 strings can't be concatenated
+        return pybase64.b64encode_as_string(all_ulaw)
     
     def cancel(self):
         """Cancel current synthesis immediately."""
@@ -7,13 +7,13 @@ This runs asynchronously after a call ends to:
 3. Generate a German summary (max 8 bullet points)
 4. Extract memory updates for long-term context
 """
+import asyncio
 import json
-from datetime import datetime
 from typing import Optional
 from openai import AsyncOpenAI
 
 from app.config import settings
-from app.database import async_session_maker
+from app.database import async_session_maker, utcnow
 from app import crud
 from app.schemas import CallUpdate, CallAnalysisCreate
 
@@ -21,6 +21,46 @@ from app.schemas import CallUpdate, CallAnalysisCreate
 # Initialize OpenAI client
 client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
 
+# Post-call jobs allowed to run at once; further hang-ups queue up so a burst
+# of LLM analyses doesn't crowd out live calls on the same event loop
+POST_CALL_CONCURRENCY = 4
+_post_call_slots = asyncio.Semaphore(POST_CALL_CONCURRENCY)
+
+
+async def _run_call_completion(call_sid: str, transcript: str):
+    """Run process_call_completion once a concurrency slot is free."""
+    async with _post_call_slots:
+        await process_call_completion(call_sid, transcript)
+
+
+# Strong references to running jobs: the event loop only keeps weak ones, and
+# shutdown waits for these instead of dropping the analysis
+_post_call_tasks: set[asyncio.Task] = set()
+
+# How long shutdown waits for queued/running post-call jobs
+POST_CALL_DRAIN_TIMEOUT_SEC = 60
+
+
+def schedule_call_completion(call_sid: str, transcript: str) -> asyncio.Task:
+    """Start post-call processing in the background (bounded concurrency)."""
+    task = asyncio.create_task(_run_call_completion(call_sid, transcript))
+    _post_call_tasks.add(task)
+    task.add_done_callback(_post_call_tasks.discard)
+    return task
+
+
+async def drain_post_call_tasks(timeout: float = POST_CALL_DRAIN_TIMEOUT_SEC):
+    """Wait for pending post-call jobs on shutdown; cancel what doesn't finish in time."""
+    if not _post_call_tasks:
+        return
+    
+    print(f"Waiting for {len(_post_call_tasks)} post-call job(s)...")
+    _, pending = await asyncio.wait(set(_post_call_tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        print(f"Cancelled {len(pending)} unfinished post-call job(s)")
+
 
 async def process_call_completion(call_sid: str, transcript: str):
     """
@@ -39,7 +79,7 @@ async def process_call_completion(call_sid: str, transcript: str):
             return
         
         # Update call as completed
-        ended_at = datetime.utcnow()
+        ended_at = utcnow()
         duration = None
         if call.started_at:
             duration = int((ended_at - call.started_at).total_seconds())
@@ -8,25 +8,30 @@ State Machine:
 
 Responsibilities:
 - Receive audio from Twilio (μ-law)
-- Convert and stream to Deepgram STT
+- Stream it unchanged to Deepgram STT (μ-law)
 - Detect end-of-turn
 - Generate response with GPT-4o
 - Stream TTS back to Twilio
 - Handle barge-in (user interrupts agent)
 """
 import asyncio
+import logging
 import time
 from enum import Enum
 from typing import Optional, Callable, Awaitable
 
+import pybase64
+
 from app.config import settings
-from app.services.audio_utils import base64_ulaw_to_pcm
+from app.services.audio_utils import ulaw_to_pcm, pcm_rms, is_ulaw_silence
 from app.services.deepgram_stt import DeepgramSTT, TranscriptEvent
 from app.services.openai_llm import OpenAILLM, ConversationTurn, ToolCallRequest
 from app.services.elevenlabs_tts import ElevenLabsTTS
 from app.services.metrics import CallMetrics
 from app.services.external_tools import get_fetching_phrase
 
+logger = logging.getLogger(__name__)
+
 
 class GatewayState(Enum):
     """Voice gateway states."""
@@ -55,7 +60,7 @@ class RealtimeGateway:
         person_age: Optional[int] = None,
         personal_context: Optional[dict] = None,
         memory_context: Optional[dict] = None,
-        on_audio_out: Optional[Callable[[str, int], Awaitable[None]]] = None,  # (audio, turn_id)
+        on_audio_out: Optional[Callable[[str, int], Awaitable[bool]]] = None,  # (audio, turn_id) -> sent
         on_clear_audio: Optional[Callable[[], Awaitable[None]]] = None
     ):
         """
@@ -67,7 +72,7 @@ class RealtimeGateway:
             person_age: Age of the person (for communication style)
             personal_context: Static profile data (hobbies, sensitivities, important people)
             memory_context: Dynamic long-term memory from conversations
-            on_audio_out: Callback to send audio to Twilio (base64 μ-law)
+            on_audio_out: Callback to send audio to Twilio (base64 μ-law); returns True if sent
             on_clear_audio: Callback to clear Twilio's audio buffer (for barge-in)
         """
         self.call_sid = call_sid
@@ -116,7 +121,7 @@ class RealtimeGateway:
         # CRITICAL: Track when audio is expected to finish playing on Twilio
         # State changes to LISTENING when TTS is done, but Twilio still plays audio!
         # We need to keep barge-in detection active until audio finishes playing.
-        self._audio_playing_until = 0.0  # Unix timestamp when audio should be done
+        self._audio_playing_until = 0.0  # time.monotonic() when audio should be done
         
         # Full conversation for post-processing
         self.full_conversation: list[dict] = []
@@ -124,7 +129,7 @@ class RealtimeGateway:
     async def start(self):
         """Initialize and start all components."""
         self.metrics.start_call(self.call_sid)
-        print(f"[{self.call_sid}] Gateway starting...")
+        logger.info("[%s] Gateway starting...", self.call_sid)
         
         # Initialize STT with barge-in detection via SpeechStarted
         self.stt = DeepgramSTT(
@@ -149,7 +154,7 @@ class RealtimeGateway:
         # Enter listening state
         await self._set_state(GatewayState.LISTENING)
         
-        print(f"[{self.call_sid}] Gateway started, entering LISTENING state")
+        logger.info("[%s] Gateway started, entering LISTENING state", self.call_sid)
     
     async def send_initial_greeting(self):
         """Send personalized, variable greeting when call starts."""
@@ -180,7 +185,7 @@ class RealtimeGateway:
         
         greeting = random.choice(greetings)
         
-        print(f"[{self.call_sid}] Sending greeting: {greeting}")
+        logger.debug("[%s] Sending greeting: %s", self.call_sid, greeting)
         
         await self._set_state(GatewayState.SPEAKING)
         await self._speak(greeting)
@@ -199,8 +204,8 @@ class RealtimeGateway:
         Args:
             b64_ulaw: Base64 encoded μ-law audio
         """
-        # Convert to PCM for Deepgram
-        pcm_bytes = base64_ulaw_to_pcm(b64_ulaw)
+        # Deepgram takes μ-law as-is; PCM is only needed for the local VAD below
+        ulaw_bytes = pybase64.b64decode(b64_ulaw)
         
         # LOCAL VAD: Check audio energy for barge-in detection
         # This is INSTANT - no waiting for Deepgram!
@@ -211,17 +216,21 @@ class RealtimeGateway:
         # ALSO: Check if audio is still playing on Twilio!
         # The state may have changed to LISTENING, but Twilio is still playing audio.
         # We need to detect barge-in until the audio finishes playing.
-        audio_still_playing = time.time() < self._audio_playing_until
+        audio_still_playing = time.monotonic() < self._audio_playing_until
         can_bargein = (self.state == GatewayState.SPEAKING or audio_still_playing) and self._audio_sent_count >= self._min_audio_before_bargein
         
         if can_bargein:
-            energy = self._calculate_audio_energy(pcm_bytes)
+            # Digital silence (muted/quiet line) can't be speech: skip the decode
+            if is_ulaw_silence(ulaw_bytes):
+                energy = 0.0
+            else:
+                energy = self._calculate_audio_energy(ulaw_to_pcm(ulaw_bytes))
             if energy > self._vad_threshold:
                 self._consecutive_speech_frames += 1
                 # Require 3 consecutive frames of speech to avoid false positives
                 if self._consecutive_speech_frames >= 3:
                     state_info = f"state={self.state.value}, audio_playing={audio_still_playing}"
-                    print(f"[{self.call_sid}] BARGE-IN via local VAD (energy={energy:.0f}, {state_info}, chunks={self._audio_sent_count}) - stopping agent!")
+                    logger.info("[%s] BARGE-IN via local VAD (energy=%.0f, %s, chunks=%s) - stopping agent!", self.call_sid, energy, state_info, self._audio_sent_count)
                     self.metrics.record_barge_in()
                     await self._handle_barge_in()
                     self._consecutive_speech_frames = 0
@@ -230,7 +239,7 @@ class RealtimeGateway:
         
         # Always send to STT
         if self.stt:
-            await self.stt.send_audio(pcm_bytes)
+            await self.stt.send_audio(ulaw_bytes)
         
         # Track speech timing
         self._last_speech_time = time.time()
@@ -286,26 +295,7 @@ class RealtimeGateway:
         Returns:
             RMS energy value (0-32767 range)
         """
-        import struct
-        
-        if len(pcm_bytes) < 2:
-            return 0.0
-        
-        # Unpack PCM samples (16-bit signed)
-        num_samples = len(pcm_bytes) // 2
-        try:
-            samples = struct.unpack(f'<{num_samples}h', pcm_bytes[:num_samples*2])
-        except struct.error:
-            return 0.0
-        
-        # Calculate RMS energy
-        if not samples:
-            return 0.0
-        
-        sum_squares = sum(s * s for s in samples)
-        rms = (sum_squares / len(samples)) ** 0.5
-        
-        return rms
+        return pcm_rms(pcm_bytes)
     
     async def _on_speech_started(self):
         """
@@ -314,7 +304,7 @@ class RealtimeGateway:
         Used for fast barge-in detection.
         """
         current_state = self.state
-        audio_still_playing = time.time() < self._audio_playing_until
+        audio_still_playing = time.monotonic() < self._audio_playing_until
         
         # Barge-in: user started speaking while agent is speaking OR audio still playing
         # CRITICAL: Only allow barge-in AFTER we've actually sent some audio!
@@ -323,7 +313,7 @@ class RealtimeGateway:
         
         if can_bargein:
             state_info = f"state={current_state.value}, audio_playing={audio_still_playing}"
-            print(f"[{self.call_sid}] BARGE-IN via SpeechStarted ({state_info}, chunks={self._audio_sent_count}) - stopping agent NOW!")
+            logger.info("[%s] BARGE-IN via SpeechStarted (%s, chunks=%s) - stopping agent NOW!", self.call_sid, state_info, self._audio_sent_count)
             self.metrics.record_barge_in()
             await self._handle_barge_in()
     
@@ -335,7 +325,7 @@ class RealtimeGateway:
             event: Transcript event with text and metadata
         """
         current_state = self.state
-        audio_still_playing = time.time() < self._audio_playing_until
+        audio_still_playing = time.monotonic() < self._audio_playing_until
         
         # Note: Barge-in is now handled by _on_speech_started (faster)
         # But keep this as backup for transcript-based detection
@@ -343,7 +333,7 @@ class RealtimeGateway:
         can_bargein = (current_state == GatewayState.SPEAKING or audio_still_playing) and self._audio_sent_count >= self._min_audio_before_bargein
         
         if can_bargein and event.text:
-            print(f"[{self.call_sid}] BARGE-IN (transcript backup, after {self._audio_sent_count} chunks): '{event.text[:50]}...'")
+            logger.info("[%s] BARGE-IN (transcript backup, after %s chunks): '%s...'", self.call_sid, self._audio_sent_count, event.text[:50])
             self.metrics.record_barge_in()
             self._barge_in_text = event.text
             await self._handle_barge_in()
@@ -369,14 +359,14 @@ class RealtimeGateway:
                         self._current_utterance += " " + new_text
                 else:
                     self._current_utterance = event.text
-                print(f"[{self.call_sid}] STT accumulated: '{self._current_utterance}'")
+                logger.debug("[%s] STT accumulated: '%s'", self.call_sid, self._current_utterance)
             else:
                 # For partials, we just track that speech is happening
                 self.metrics.stt_partial_count += 1
         
         # Check for end of turn (speech_final from Deepgram or UtteranceEnd)
         if event.speech_final:
-            print(f"[{self.call_sid}] speech_final received, utterance='{self._current_utterance[:50] if self._current_utterance else '(empty)'}...'")
+            logger.debug("[%s] speech_final received, utterance='%s...'", self.call_sid, self._current_utterance[:50] if self._current_utterance else '(empty)')
             
             if self._current_utterance:
                 # Check if utterance is just a filler word (user still thinking)
@@ -388,10 +378,10 @@ class RealtimeGateway:
                 
                 # If the entire utterance is just a filler word, wait for more
                 if utterance_clean in FILLER_WORDS:
-                    print(f"[{self.call_sid}] Filler word detected, waiting for more: '{self._current_utterance}'")
+                    logger.debug("[%s] Filler word detected, waiting for more: '%s'", self.call_sid, self._current_utterance)
                     return
                 
-                print(f"[{self.call_sid}] End of turn detected: '{self._current_utterance}'")
+                logger.info("[%s] End of turn detected: '%s'", self.call_sid, self._current_utterance)
                 self.metrics.end_user_speech()
                 self.metrics.stt_final()
                 
@@ -406,7 +396,7 @@ class RealtimeGateway:
         self._current_turn_id += 1
         my_turn_id = self._current_turn_id
         
-        print(f"[{self.call_sid}] TURN {my_turn_id} STARTED")
+        logger.info("[%s] TURN %s STARTED", self.call_sid, my_turn_id)
         
         # Reset flags for new turn
         self._cancelled = False
@@ -435,7 +425,7 @@ class RealtimeGateway:
             # CRITICAL: Check BOTH cancelled flag AND turn ID
             # Turn ID prevents race condition where new turn resets _cancelled
             if self._cancelled or self._current_turn_id != my_turn_id:
-                print(f"[{self.call_sid}] TURN {my_turn_id} STALE - skipping sentence (current={self._current_turn_id}, cancelled={self._cancelled})")
+                logger.debug("[%s] TURN %s STALE - skipping sentence (current=%s, cancelled=%s)", self.call_sid, my_turn_id, self._current_turn_id, self._cancelled)
                 return
             
             response_text += sentence + " "
@@ -448,25 +438,8 @@ class RealtimeGateway:
             await self._set_state(GatewayState.SPEAKING)
             self.metrics.tts_start()
             
-            first_audio = True
-            
-            async def on_tts_audio(b64_ulaw: str):
-                nonlocal first_audio
-                
-                # CRITICAL: Check BOTH cancelled flag AND turn ID
-                if self._cancelled or self._current_turn_id != my_turn_id:
-                    return
-                
-                if first_audio:
-                    self.metrics.tts_first_audio()
-                    first_audio = False
-                
-                if self.on_audio_out:
-                    # Pass turn ID so Twilio callback can also verify
-                    await self.on_audio_out(b64_ulaw, my_turn_id)
-            
             # Synthesize and stream this sentence
-            await self.tts.synthesize_to_ulaw(sentence, on_tts_audio)
+            await self.tts.synthesize_to_ulaw(sentence, self._audio_sink(my_turn_id))
         
         try:
             # First LLM call - may return text or tool call request
@@ -474,7 +447,7 @@ class RealtimeGateway:
             
             # Check if this turn was cancelled during generation
             if self._cancelled or self._current_turn_id != my_turn_id:
-                print(f"[{self.call_sid}] TURN {my_turn_id} CANCELLED - not completing")
+                logger.debug("[%s] TURN %s CANCELLED - not completing", self.call_sid, my_turn_id)
                 await self._set_state(GatewayState.LISTENING)
                 return
             
@@ -484,7 +457,7 @@ class RealtimeGateway:
                 
                 # Check again after tool call
                 if self._cancelled or self._current_turn_id != my_turn_id:
-                    print(f"[{self.call_sid}] TURN {my_turn_id} CANCELLED after tool - not completing")
+                    logger.debug("[%s] TURN %s CANCELLED after tool - not completing", self.call_sid, my_turn_id)
                     await self._set_state(GatewayState.LISTENING)
                     return
             else:
@@ -492,7 +465,7 @@ class RealtimeGateway:
                 self.metrics.tts_complete()
                 
         except Exception as e:
-            print(f"[{self.call_sid}] Response generation error: {e}")
+            logger.error("[%s] Response generation error: %s", self.call_sid, e)
             await self._set_state(GatewayState.LISTENING)
             return
         
@@ -503,9 +476,9 @@ class RealtimeGateway:
             
             # End turn and emit metrics
             self.metrics.end_turn()
-            print(f"[{self.call_sid}] TURN {my_turn_id} COMPLETED")
+            logger.info("[%s] TURN %s COMPLETED", self.call_sid, my_turn_id)
         else:
-            print(f"[{self.call_sid}] TURN {my_turn_id} NOT completed (cancelled={self._cancelled}, current={self._current_turn_id})")
+            logger.debug("[%s] TURN %s NOT completed (cancelled=%s, current=%s)", self.call_sid, my_turn_id, self._cancelled, self._current_turn_id)
         
         await self._set_state(GatewayState.LISTENING)
         
@@ -535,36 +508,19 @@ class RealtimeGateway:
         # Capture turn ID for this tool call
         my_turn_id = self._current_turn_id
         
-        print(f"[{self.call_sid}] Handling tool call: {tool_call.tool_name} (turn {my_turn_id})")
+        logger.info("[%s] Handling tool call: %s (turn %s)", self.call_sid, tool_call.tool_name, my_turn_id)
         
         # 1. Say a "fetching" phrase so user knows we're working on it
         fetching_phrase = get_fetching_phrase()
         await self._set_state(GatewayState.SPEAKING)
         self.metrics.tts_start()
         
-        first_audio = True
-        
-        async def on_fetching_audio(b64_ulaw: str):
-            nonlocal first_audio
-            
-            # Stop if barge-in happened or turn changed
-            if self._cancelled or self._current_turn_id != my_turn_id:
-                return
-            
-            if first_audio:
-                self.metrics.tts_first_audio()
-                first_audio = False
-            
-            if self.on_audio_out:
-                # Pass turn ID so Twilio callback can also verify
-                await self.on_audio_out(b64_ulaw, my_turn_id)
-        
-        await self.tts.synthesize_to_ulaw(fetching_phrase, on_fetching_audio)
+        await self.tts.synthesize_to_ulaw(fetching_phrase, self._audio_sink(my_turn_id))
         
         # Add fetching phrase to conversation
         self.full_conversation.append({"role": "assistant", "content": fetching_phrase})
         
-        print(f"[{self.call_sid}] Spoke fetching phrase: '{fetching_phrase}'")
+        logger.debug("[%s] Spoke fetching phrase: '%s'", self.call_sid, fetching_phrase)
         
         # 2. Execute the tool (while still in SPEAKING state to prevent barge-in during fetch)
         tool_result = await self.llm.tools.execute_tool(
@@ -572,11 +528,11 @@ class RealtimeGateway:
             tool_call.arguments
         )
         
-        print(f"[{self.call_sid}] Tool result received ({len(tool_result)} chars)")
+        logger.debug("[%s] Tool result received (%s chars)", self.call_sid, len(tool_result))
         
         # Check if cancelled during tool execution or turn changed
         if self._cancelled or self._current_turn_id != my_turn_id:
-            print(f"[{self.call_sid}] Tool call aborted - turn changed or cancelled")
+            logger.debug("[%s] Tool call aborted - turn changed or cancelled", self.call_sid)
             return
         
         # 3. Call LLM again with tool result
@@ -604,28 +560,58 @@ class RealtimeGateway:
         my_turn_id = self._current_turn_id
         
         self.metrics.tts_start()
+        
+        await self.tts.synthesize_to_ulaw(text, self._audio_sink(my_turn_id))
+        self.metrics.tts_complete()
+        
+        # Add to conversation
+        self.full_conversation.append({"role": "assistant", "content": text})
+    
+    def _audio_sink(self, turn_id: int) -> Callable[[str, int], Awaitable[None]]:
+        """
+        Build the TTS audio callback for one utterance of a turn.
+        
+        Drops audio once the turn is cancelled or superseded, records TTS
+        first-audio latency, forwards chunks to Twilio and keeps track of how
+        long Twilio will still be playing what was sent.
+        """
         first_audio = True
         
-        async def on_audio(b64_ulaw: str):
+        async def on_audio(b64_ulaw: str, ulaw_bytes: int):
             nonlocal first_audio
             
-            # Stop if barge-in happened or turn changed
-            if self._cancelled or self._current_turn_id != my_turn_id:
+            # CRITICAL: Check BOTH cancelled flag AND turn ID
+            if self._cancelled or self._current_turn_id != turn_id:
                 return
             
             if first_audio:
                 self.metrics.tts_first_audio()
                 first_audio = False
             
-            if self.on_audio_out:
-                # Pass turn ID so Twilio callback can also verify
-                await self.on_audio_out(b64_ulaw, my_turn_id)
+            # Pass turn ID so Twilio callback can also verify
+            if self.on_audio_out and await self.on_audio_out(b64_ulaw, turn_id):
+                # Track that we've sent audio - needed for barge-in timing
+                self._audio_sent_count += 1
+                self._track_playback(ulaw_bytes)
         
-        await self.tts.synthesize_to_ulaw(text, on_audio)
-        self.metrics.tts_complete()
+        return on_audio
+    
+    def _track_playback(self, ulaw_bytes: int):
+        """
+        Extend the expected end of Twilio playback by one sent chunk.
         
-        # Add to conversation
-        self.full_conversation.append({"role": "assistant", "content": text})
+        μ-law audio: 8kHz sample rate, 1 byte per sample. Chunks are QUEUED on
+        Twilio, not overlapping, so each chunk's duration is ADDED to the end.
+        """
+        audio_duration_sec = ulaw_bytes / 8000
+        now = time.monotonic()
+        
+        if self._audio_playing_until < now:
+            # No audio in buffer, start from now
+            self._audio_playing_until = now + audio_duration_sec + 0.3
+        else:
+            # Audio already in buffer, add this chunk's duration to the end
+            self._audio_playing_until += audio_duration_sec
     
     async def _handle_barge_in(self):
         """Handle user interruption (barge-in)."""
@@ -633,7 +619,7 @@ class RealtimeGateway:
         # Turn ID is ONLY incremented in _process_turn when a new turn starts.
         # This ensures Turn IDs are strictly monotonic without gaps.
         
-        print(f"[{self.call_sid}] BARGE-IN: Turn {self._current_turn_id} cancelled")
+        logger.info("[%s] BARGE-IN: Turn %s cancelled", self.call_sid, self._current_turn_id)
         
         # Set cancelled flag to stop any ongoing callbacks
         self._cancelled = True
@@ -646,9 +632,9 @@ class RealtimeGateway:
         if self.on_clear_audio:
             try:
                 await self.on_clear_audio()
-                print(f"[{self.call_sid}] Twilio audio buffer cleared for turn {self._current_turn_id}")
+                logger.debug("[%s] Twilio audio buffer cleared for turn %s", self.call_sid, self._current_turn_id)
             except Exception as e:
-                print(f"[{self.call_sid}] Error clearing audio buffer: {e}")
+                logger.warning("[%s] Error clearing audio buffer: %s", self.call_sid, e)
         
         # Cancel LLM generation
         if self.llm:
@@ -671,7 +657,7 @@ class RealtimeGateway:
         # This is what the user was saying when they interrupted
         if self._barge_in_text:
             self._current_utterance = self._barge_in_text
-            print(f"[{self.call_sid}] Barge-in text captured: '{self._barge_in_text}'")
+            logger.debug("[%s] Barge-in text captured: '%s'", self.call_sid, self._barge_in_text)
             self._barge_in_text = ""
         else:
             self._current_utterance = ""
@@ -686,7 +672,7 @@ class RealtimeGateway:
             old_state = self.state
             self.state = new_state
             if old_state != new_state:
-                print(f"[{self.call_sid}] State: {old_state.value} -> {new_state.value}")
+                logger.debug("[%s] State: %s -> %s", self.call_sid, old_state.value, new_state.value)
     
     def get_full_transcript(self) -> str:
         """Get full conversation as text for post-processing."""
@@ -698,7 +684,7 @@ class RealtimeGateway:
     
     async def stop(self):
         """Stop and cleanup all components."""
-        print(f"[{self.call_sid}] Gateway stopping...")
+        logger.info("[%s] Gateway stopping...", self.call_sid)
         
         self.metrics.end_call()
         
@@ -717,7 +703,7 @@ class RealtimeGateway:
         
         # Log metrics
         summary = self.metrics.get_summary()
-        print(f"[{self.call_sid}] Call summary: {summary}")
+        logger.info("[%s] Call summary: %s", self.call_sid, summary)
         
-        print(f"[{self.call_sid}] Gateway stopped")
+        logger.info("[%s] Gateway stopped", self.call_sid)
 